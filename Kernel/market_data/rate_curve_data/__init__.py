@@ -1,2 +1,2 @@
 from .rate_curve import RateCurve
-from .enums_interpolators import InterpolationType
\ No newline at end of file
+from .enums_interpolators import InterpolationType, INTERPOLATORS, get_interpolator_class
\ No newline at end of file
@@ -1,8 +1,28 @@
 from enum import Enum
+from typing import Dict, Union
 from .interpolators import LinearInterpolator, CubicInterpolator, NelsonSiegelInterpolator, SvenssonInterpolator
 
 class InterpolationType(Enum):
     LINEAR = LinearInterpolator
     CUBIC = CubicInterpolator
     NELSON_SIEGEL = NelsonSiegelInterpolator
-    SVENSSON = SvenssonInterpolator
\ No newline at end of file
+    SVENSSON = SvenssonInterpolator
+
+# Plain dict lookup, built once, to avoid going through the Enum descriptors each time a curve is (re)built
+INTERPOLATORS: Dict[str, type] = {member.name: member.value for member in InterpolationType}
+
+def get_interpolator_class(interpolation_type: Union[InterpolationType, str]) -> type:
+    """
+    Returns the interpolator class for an interpolation type given as an InterpolationType member or by name.
+
+    Parameters:
+        interpolation_type (Union[InterpolationType, str]): The interpolation method, e.g. InterpolationType.CUBIC or "CUBIC".
+
+    Returns:
+        type: The interpolator class to instantiate.
+    """
+    name = interpolation_type if isinstance(interpolation_type, str) else interpolation_type.name
+    try:
+        return INTERPOLATORS[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown interpolation type: {interpolation_type}.") from None
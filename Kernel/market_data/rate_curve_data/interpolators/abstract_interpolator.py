@@ -6,13 +6,21 @@ class Interpolator(ABC):
     def __init__(self, maturities: np.ndarray[float], rates: np.ndarray[float]):
         """
         Initializes the interpolator with observed market rates and calibrates it.
+        The market data is normalized once into contiguous float64 arrays sorted by maturity.
 
         Parameters:
             maturities (np.ndarray[float]): Array of maturities (in years).
             rates (np.ndarray[float]): Array of observed yield rates corresponding to the maturities.
+
+        Raises:
+            ValueError: If the same maturity is quoted twice.
         """
-        self.maturities = maturities
-        self.rates = rates
+        maturities = np.asarray(maturities, dtype=np.float64)
+        order = np.argsort(maturities, kind="stable")
+        self.maturities = np.ascontiguousarray(maturities[order])
+        self.rates = np.ascontiguousarray(np.asarray(rates, dtype=np.float64)[order])
+        if np.any(np.diff(self.maturities) <= 0):
+            raise ValueError("Maturities must be unique to calibrate the interpolator.")
 
     @abstractmethod
     def calibrate(self):
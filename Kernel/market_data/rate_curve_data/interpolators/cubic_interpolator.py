@@ -1,4 +1,5 @@
 import numpy as np
+from bisect import bisect_right
 from .abstract_interpolator import Interpolator
 from scipy.interpolate import CubicSpline
 
@@ -19,11 +20,17 @@ class CubicInterpolator(Interpolator):
         """
         Calibrates the CubicInterpolator by fitting the observed market rates.
         """
+        # The piecewise polynomial form of CubicSpline is kept rather than a B-spline (make_interp_spline):
+        # on yield curve grids, PPoly evaluates arrays of maturities faster than BSpline's de Boor evaluation
         self.interpolator = CubicSpline(self.maturities, self.rates, bc_type='natural', extrapolate=True)
+        # The calibrated curve is static: flatten its breakpoints and piecewise coefficients (c0, c1, c2, c3)
+        # so that scalar maturities are evaluated without going through the scipy wrapper
+        self._breakpoints = self.interpolator.x.tolist()
+        self._coefficients = [tuple(c) for c in self.interpolator.c.T.tolist()]
 
     def interpolate(self, t: float) -> float:
         """
-        Interpolates the yield for a given maturity using the calibrated CubicSpline model.
+        Interpolates the yield for a given maturity (or array of maturities) using the calibrated CubicSpline model.
 
         Parameters:
             t (float): Maturity at which to estimate the yield.
@@ -33,4 +40,14 @@ class CubicInterpolator(Interpolator):
         """
         if self.interpolator is None:
             raise ValueError("Interpolator has not been calibrated. Please call the 'calibrate' method first.")
-        return self.interpolator(t)
\ No newline at end of file
+        if np.ndim(t) != 0:
+            # Arrays are evaluated in a single call to scipy's compiled evaluator
+            return self.interpolator(t)
+
+        # Scalar fast path: the first and last polynomials are used for extrapolation, and the summation
+        # order is the one of scipy's PPoly so that the values are identical to CubicSpline
+        t = float(t)
+        i = min(max(bisect_right(self._breakpoints, t) - 1, 0), len(self._coefficients) - 1)
+        c0, c1, c2, c3 = self._coefficients[i]
+        dt = t - self._breakpoints[i]
+        return c3 + c2 * dt + c1 * (dt * dt) + c0 * (dt * dt * dt)
\ No newline at end of file
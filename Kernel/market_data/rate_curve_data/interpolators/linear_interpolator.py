@@ -1,5 +1,5 @@
+import numpy as np
 from .abstract_interpolator import Interpolator
-from scipy.interpolate import interp1d
 
 class LinearInterpolator(Interpolator):
 
@@ -12,17 +12,23 @@ class LinearInterpolator(Interpolator):
             rates (np.ndarray[float]): List of observed yield rates corresponding to the maturities.
         """
         super().__init__(maturities, rates)
-        self.interpolator = None
+        self._maturities = None
+        self._rates = None
 
     def calibrate(self):
         """
-        Calibrates the LinearInterpolator by fitting the observed market rates.
+        Calibrates the LinearInterpolator by precomputing the slopes of the first and last segments used for extrapolation.
+        The market rates are already sorted by maturity by the base interpolator.
         """
-        self.interpolator = interp1d(self.maturities, self.rates, kind='linear', fill_value='extrapolate')
-        
+        self._maturities = self.maturities
+        self._rates = self.rates
+        self._left_slope = (self._rates[1] - self._rates[0]) / (self._maturities[1] - self._maturities[0])
+        self._right_slope = (self._rates[-1] - self._rates[-2]) / (self._maturities[-1] - self._maturities[-2])
+
     def interpolate(self, t: float) -> float:
         """
-        Interpolates the yield for a given maturity using the calibrated linear model.
+        Interpolates the yield for a given maturity (or array of maturities) using the calibrated linear model.
+        Maturities outside the market range are linearly extrapolated from the first and last segments.
 
         Parameters:
             t (float): Maturity at which to estimate the yield.
@@ -30,6 +36,9 @@ class LinearInterpolator(Interpolator):
         Returns:
             float: Estimated yield rate for the given maturity.
         """
-        if self.interpolator is None:
+        if self._maturities is None:
             raise ValueError("Interpolator has not been calibrated. Please call the 'calibrate' method first.")
-        return self.interpolator(t)
\ No newline at end of file
+        t = np.asarray(t, dtype=np.float64)
+        rates = np.interp(t, self._maturities, self._rates)
+        rates = np.where(t < self._maturities[0], self._rates[0] + (t - self._maturities[0]) * self._left_slope, rates)
+        return np.where(t > self._maturities[-1], self._rates[-1] + (t - self._maturities[-1]) * self._right_slope, rates)
\ No newline at end of file
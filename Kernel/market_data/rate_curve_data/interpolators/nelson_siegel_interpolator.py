@@ -28,14 +28,18 @@ class NelsonSiegelInterpolator(Interpolator):
         Computes the yield at a given maturity using the Nelson-Siegel model formula.
 
         Parameters:
-            t (float): Maturity in years.
+            t (float or np.ndarray): Maturity (or maturities) in years.
             beta0, beta1, beta2, tau (floats): Model parameters 
 
         Returns:
-            float: Yield rate for the given maturity.
+            float or np.ndarray: Yield rate for the given maturity.
         """
-        return beta0 + beta1 * (1 - np.exp(-t / tau)) / (t / tau) + beta2 * (
-            (1 - np.exp(-t / tau)) / (t / tau) - np.exp(-t / tau))
+        x = np.asarray(t, dtype=float) / tau
+        decay = np.exp(-x)
+        # (1 - e^-x) / x tends to 1 when t -> 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(x == 0, 1.0, (1 - decay) / x)
+        return beta0 + beta1 * slope + beta2 * (slope - decay)
 
     def calibrate(self) -> np.ndarray[float]:
         """
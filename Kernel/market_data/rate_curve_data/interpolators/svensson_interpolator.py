@@ -43,9 +43,17 @@ class SvenssonInterpolator(Interpolator):
             float: Yield rate for the given maturity.
         """
 
-        term1 = beta1 * (1 - np.exp(-t / tau1)) / (t / tau1)
-        term2 = beta2 * ((1 - np.exp(-t / tau1)) / (t / tau1) - np.exp(-t / tau1))
-        term3 = beta3 * ((1 - np.exp(-t / tau2)) / (t / tau2) - np.exp(-t / tau2))
+        t = np.asarray(t, dtype=float)
+        x1, x2 = t / tau1, t / tau2
+        decay1, decay2 = np.exp(-x1), np.exp(-x2)
+        # (1 - e^-x) / x tends to 1 when t -> 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope1 = np.where(x1 == 0, 1.0, (1 - decay1) / x1)
+            slope2 = np.where(x2 == 0, 1.0, (1 - decay2) / x2)
+
+        term1 = beta1 * slope1
+        term2 = beta2 * (slope1 - decay1)
+        term3 = beta3 * (slope2 - decay2)
 
         return beta0 + term1 + term2 + term3
 
@@ -1,9 +1,8 @@
 import re
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from typing import Tuple
-import seaborn as sns
+from typing import Tuple, Union
+from .enums_interpolators import get_interpolator_class
 
 class RateCurve:
     """
@@ -13,18 +12,19 @@ class RateCurve:
     and discount factors. The interpolation can be based on different models such as Svensson, Nelson-Siegel...
     """
 
-    def __init__(self, data_curve: pd.DataFrame, interpolation_type: 'InterpolationType'):  # type: ignore
+    def __init__(self, data_curve: pd.DataFrame, interpolation_type: Union['InterpolationType', str]):  # type: ignore
         """
         Initializes the rate curve with market data and an interpolation method.
 
         Parameters:
             data_curve (pd.DataFrame): Market yield data with 'Maturity'and 'Rate' columns.
-            interpolation_type (InterpolationType): The interpolation method to use for yield curve fitting.
+            interpolation_type (Union[InterpolationType, str]): The interpolation method to use for yield curve fitting,
+                given as an InterpolationType member or by name (e.g. "CUBIC").
         """
         self.data_curve = data_curve
         maturities, rates = np.array(self.data_curve["Maturity"]), np.array(self.data_curve["Rate"])
 
-        self.interpolator = interpolation_type.value(maturities, rates)
+        self.interpolator = get_interpolator_class(interpolation_type)(maturities, rates)
 
     def calibrate(self) -> None:
         """
@@ -32,28 +32,34 @@ class RateCurve:
         """
         self.interpolator.calibrate()
 
-    def get_rate(self, maturity: float) -> float:
+    def get_rate(self, maturity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
-        Retrieves the interpolated yield rate for a given maturity.
+        Retrieves the interpolated yield rate for a given maturity (or array of maturities).
+        Arrays are forwarded to the interpolator in a single vectorized call.
 
         Parameters:
-            maturity (float): Desired maturity in years.
+            maturity (Union[float, np.ndarray]): Desired maturity (or maturities) in years.
 
         Returns:
-            float: Interpolated yield rate.
+            Union[float, np.ndarray]: Interpolated yield rate(s).
         """
-        return self.interpolator.interpolate(maturity)
+        rates = self.interpolator.interpolate(maturity)
+        if np.ndim(maturity) == 0:
+            return float(rates)
+        return np.asarray(rates)
 
     def display_curve(self) -> None:
         """
         Plots the yield curve based on market data and the chosen interpolated yield.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         maturities = np.linspace(0, 30, 500)
-        yield_curve = np.array([self.get_rate(mat) for mat in maturities])
+        yield_curve = self.get_rate(maturities)
 
         sns.set(style="whitegrid")
         palette = sns.color_palette("coolwarm", 2)
-        plt.figure(figsize=(10, 6))
+        fig = plt.figure(figsize=(10, 6))
         plt.scatter(self.data_curve['Maturity'], self.data_curve['Rate'], color=palette[0], label='Market yields', zorder=5)
         plt.plot(maturities, yield_curve, label='Interpolated yield curve', color=palette[1], linewidth=2)
         plt.xlabel('Maturity (Years)', fontsize=12)
@@ -62,4 +68,5 @@ class RateCurve:
         plt.legend(fontsize=10)
         plt.grid(True, linestyle='--', alpha=0.7)
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        plt.show()
+        plt.close(fig)  # Release the figure from the pyplot registry
\ No newline at end of file
@@ -1,7 +1,29 @@
 from enum import Enum
-from ..volatility_surface import *
+from typing import Dict, Union
+from .local_surface import LocalVolatilitySurface
+from .svi_surface import SVIVolatilitySurface
+from .ssvi_surface import SSVIVolatilitySurface
 
 class VolatilitySurfaceType(Enum):
     LOCAL = LocalVolatilitySurface
     SVI = SVIVolatilitySurface
     SSVI = SSVIVolatilitySurface
+
+# Plain dict lookup, built once, to avoid going through the Enum descriptors each time a surface is (re)built
+VOLATILITY_SURFACES: Dict[str, type] = {member.name: member.value for member in VolatilitySurfaceType}
+
+def get_volatility_surface_class(volatility_surface_type: Union[VolatilitySurfaceType, str]) -> type:
+    """
+    Returns the volatility surface class for a surface type given as a VolatilitySurfaceType member or by name.
+
+    Parameters:
+        volatility_surface_type (Union[VolatilitySurfaceType, str]): The surface model, e.g. VolatilitySurfaceType.SVI or "SVI".
+
+    Returns:
+        type: The volatility surface class to instantiate.
+    """
+    name = volatility_surface_type if isinstance(volatility_surface_type, str) else volatility_surface_type.name
+    try:
+        return VOLATILITY_SURFACES[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown volatility surface type: {volatility_surface_type}.") from None
@@ -1,10 +1,115 @@
 import os
+import math
 import numpy as np
 import pandas as pd
 from kernel.tools import *
-from kernel.market_data import RateCurve, InterpolationType,UnderlyingAsset, VolatilitySurfaceType, SVIVolatilitySurface
+from kernel.market_data import RateCurve, InterpolationType,UnderlyingAsset, VolatilitySurfaceType, SVIVolatilitySurface, LocalVolatilitySurface, get_volatility_surface_class
 import re
 import copy
+from functools import lru_cache
+from collections import OrderedDict
+from types import SimpleNamespace
+
+# Maturity format (e.g. '10Y', '6M', '3W') and number of periods per year for each unit
+_MATURITY_RE = re.compile(r"^(\d+)([MWY])")
+_PERIODS_PER_YEAR = {"W": 52.0, "M": 12.0, "Y": 1.0}
+
+# Precision used to quantize the (strike, maturity) keys of the rate and volatility caches
+_CACHE_DECIMALS = 9
+# Number of most recently used entries kept by each of these caches
+_CACHE_MAXSIZE = 4096
+
+
+class _LRUCache(OrderedDict):
+    """
+    Memo bounded to its maxsize most recently used entries, the least recently used one being evicted first.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_MAXSIZE):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+@lru_cache(maxsize=32)
+def _read_table(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Reads an Excel market data file.
+    Cached in process on (path, modification time) so that an edited file is reloaded.
+
+    Parameters:
+        path (str): Path of the Excel file
+        mtime (float): Modification time of the Excel file
+
+    Returns:
+        pd.DataFrame: The file content
+    """
+    return pd.read_excel(path)
+
+
+def _load_table(path: str) -> pd.DataFrame:
+    """
+    Loads a market data file from the cache. A copy is returned since the callers modify the data in place.
+
+    Parameters:
+        path (str): Path of the Excel file
+
+    Returns:
+        pd.DataFrame: The file content
+    """
+    return _read_table(path, os.path.getmtime(path)).copy()
+
+
+def _require_columns(table: pd.DataFrame, columns: tuple) -> None:
+    """
+    Checks that a market data table contains the mandatory columns.
+
+    Parameters:
+        table (pd.DataFrame): The loaded market data
+        columns (tuple): The mandatory column labels
+
+    Raises:
+        ValueError: If some of the columns are missing
+    """
+    missing_columns = set(columns).difference(table.columns)
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {', '.join(sorted(missing_columns))}")
+
+
+@lru_cache(maxsize=1)
+def _load_underlying_index(path: str, mtime: float) -> dict:
+    """
+    Builds the index of the underlying assets file, mapping each ticker to its informations.
+    Cached in process on (path, modification time) so that an edited file is reloaded.
+
+    Parameters:
+        path (str): Path of the Excel file
+        mtime (float): Modification time of the Excel file
+
+    Returns:
+        dict: Underlying informations (ticker, isin, is_index, last_price) indexed by ticker
+    """
+    df_underlying = _read_table(path, mtime)
+
+    _require_columns(df_underlying, ("Security Label", "Ticker", "ISIN", "Is Index", "Last Price"))
+
+    index = {}
+    for ticker, isin, is_index, last_price in df_underlying[["Ticker", "ISIN", "Is Index", "Last Price"]].itertuples(index=False):
+        # The first row of a ticker is kept, as with the former boolean mask lookup
+        index.setdefault(ticker, SimpleNamespace(ticker=str(ticker), isin=str(isin),
+                                                 is_index=bool(is_index), last_price=float(last_price)))
+    return index
 
 
 class Market:
@@ -38,8 +143,13 @@ class Market:
         self.rate_curve_type = rate_curve_type
         self.interpolation_type = interpolation_type
         self.volatility_surface_type = volatility_surface_type
+        self._volatility_surface_class = get_volatility_surface_class(volatility_surface_type)
         self.calendar_convention = calendar_convention
         self.obs_frequency = obs_frequency
+
+        # Memoized curve and surface evaluations, cleared whenever the curve or the surface is (re)built
+        self._rate_cache = _LRUCache()
+        self._volatility_cache = _LRUCache()
         
         self.rate_curve = None
         self._fetch_yield_curves()
@@ -47,6 +157,7 @@ class Market:
         self.underlying_asset = UnderlyingAsset(underlying_name)
         self._fetch_underlying_info()
 
+        # The volatility surface needs both the rate curve and the underlying spot
         self.volatility_surface = None
         self._fetch_volatility_surface()
 
@@ -61,7 +172,7 @@ class Market:
         Returns:
             float: Maturity expressed in years.
         """
-        match = re.match(r"(\d+)([MWY])", maturity)
+        match = _MATURITY_RE.match(maturity)
         if not match:
             raise ValueError(f"Invalid maturity: {maturity}")
 
@@ -75,6 +186,27 @@ class Market:
             return value       # Already in years
         else:
             raise ValueError(f"Unrecognized unit: {unit}")
+
+    @classmethod
+    def _convert_maturities_vec(cls, maturities: pd.Series) -> np.ndarray:
+        """
+        Converts a whole column of maturity strings (e.g., '10Y', '6M', '3W') into years in a single vectorized pass.
+
+        Parameters:
+            maturities (pd.Series): Maturities in standard financial format.
+
+        Returns:
+            np.ndarray: Maturities expressed in years.
+        """
+        parts = maturities.astype(str).str.extract(_MATURITY_RE)
+        values = parts[0].to_numpy(dtype=np.float64, na_value=np.nan)
+        periods_per_year = parts[1].map(_PERIODS_PER_YEAR).to_numpy(dtype=np.float64, na_value=np.nan)
+        years = values / periods_per_year
+
+        invalid = np.isnan(years)
+        if invalid.any():
+            raise ValueError(f"Invalid maturity: {maturities[invalid].iloc[0]}")
+        return years
         
     def _fetch_yield_curves(self,bump: float = 0.0):
         """
@@ -86,19 +218,17 @@ class Market:
         if not os.path.exists(f"data/yield_curves/{self.rate_curve_type.value}"):
             raise FileNotFoundError(f"'data/yield_curves/{self.rate_curve_type.value}' does not exist.")
         else:
-            data_curve = pd.read_excel(f"data/yield_curves/{self.rate_curve_type.value}")
+            data_curve = _load_table(f"data/yield_curves/{self.rate_curve_type.value}")
         
-        required_columns = ["Maturity", "Rate"]
-        missing_columns = [col for col in required_columns if col not in data_curve.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+        _require_columns(data_curve, ("Maturity", "Rate"))
         
-        data_curve["Maturity"] = data_curve["Maturity"].apply(self._convert_maturities)
+        data_curve["Maturity"] = self._convert_maturities_vec(data_curve["Maturity"])
         data_curve["Rate"] = data_curve["Rate"].astype(float) + bump
         rate_curve = RateCurve(data_curve=data_curve, interpolation_type=self.interpolation_type)
         rate_curve.calibrate()
 
         self.rate_curve = rate_curve
+        self._rate_cache.clear()
 
     def _fetch_underlying_info(self, file_path: str = "data/underlying_data.xlsx"):
         """
@@ -110,15 +240,8 @@ class Market:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-        df_underlying = pd.read_excel(file_path)
-
-        required_columns = ["Security Label", "Ticker", "ISIN", "Is Index", "Last Price"]
-        missing_columns = [col for col in required_columns if col not in df_underlying.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-
-        asset_info = df_underlying[df_underlying["Ticker"] == self.underlying_asset.name]
-        if asset_info.empty:
+        asset_info = _load_underlying_index(file_path, os.path.getmtime(file_path)).get(self.underlying_asset.name)
+        if asset_info is None:
             raise ValueError(f"No data found for security name: {self.underlying_asset.name}")
         
         self.underlying_asset.load_underlying_info(asset_info)
@@ -131,36 +254,31 @@ class Market:
         if not os.path.exists(f"data/option_data/option_data_{self.underlying_asset.ticker}.xlsx"):
             raise FileNotFoundError(f"'data/option_data/option_data_{self.underlying_asset.ticker}.xlsx' does not exist.")
         else:
-            option_data = pd.read_excel(f"data/option_data/option_data_{self.underlying_asset.ticker}.xlsx")
-
-        # Convert long format to short format
-        option_data = pd.melt(option_data, id_vars=['Maturity'], var_name='Strike', value_name='Implied Volatility')
+            option_data = _load_table(f"data/option_data/option_data_{self.underlying_asset.ticker}.xlsx")
 
         # Check for mandatory columns
-        required_columns = ["Maturity", "Implied Volatility", "Strike"]
-        missing_columns = [col for col in required_columns if col not in option_data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-        
-        # Convertions
-        option_data['Implied Volatility'] = option_data['Implied Volatility'].astype(float) + bump
-        option_data['Strike'] = option_data['Strike'].astype(float)
-        option_data["Maturity"] = option_data["Maturity"].apply(self._convert_maturities)
-        option_data["Spot"] = self.underlying_asset.last_price
-        
-        # Calibrate the rate curve if not done yet
-        if self.rate_curve is None:
-            self._fetch_yield_curves()
-        
-        if self.volatility_surface_type.name == "LOCAL":
+        _require_columns(option_data, ("Maturity",))
+
+        # Convert the wide (maturity x strike) grid to long format, in the column-major order of a melt
+        maturities = self._convert_maturities_vec(option_data["Maturity"])
+        strike_columns = option_data.columns.drop("Maturity")
+        strikes = strike_columns.astype(float).to_numpy()
+        implied_vols = option_data[strike_columns].to_numpy(dtype=np.float64)
+        option_data = pd.DataFrame({"Maturity": np.tile(maturities, len(strikes)),
+                                    "Strike": np.repeat(strikes, len(maturities)),
+                                    "Implied Volatility": implied_vols.ravel(order="F") + bump,
+                                    "Spot": self.underlying_asset.last_price})
+
+        if self._volatility_surface_class is LocalVolatilitySurface:
             svi_surface = SVIVolatilitySurface(option_data=option_data, rate_curve=self.rate_curve)
             svi_surface.calibrate_surface()
-            volatility_surface = self.volatility_surface_type.value(option_data=option_data, rate_curve=self.rate_curve, svi_surface=svi_surface)
+            volatility_surface = self._volatility_surface_class(option_data=option_data, rate_curve=self.rate_curve, svi_surface=svi_surface)
         else:
-            volatility_surface = self.volatility_surface_type.value(option_data=option_data, rate_curve=self.rate_curve)
+            volatility_surface = self._volatility_surface_class(option_data=option_data, rate_curve=self.rate_curve)
 
         volatility_surface.calibrate_surface()
         self.volatility_surface = volatility_surface
+        self._volatility_cache.clear()
 
     def get_rate(self, maturity: float) -> float:
         """
@@ -172,10 +290,27 @@ class Market:
         Returns:
             float: Interpolated yield rate
         """
-        if not self.rate_curve:
-            self._fetch_yield_curves()
-        return self.rate_curve.get_rate(maturity) / 100
+        if np.ndim(maturity) != 0:
+            return self.get_rates(maturity)
+
+        key = round(maturity, _CACHE_DECIMALS)
+        rate = self._rate_cache.get(key)
+        if rate is None:
+            rate = self._rate_cache[key] = self.rate_curve.get_rate(maturity) / 100
+        return rate
     
+    def get_rates(self, maturities: np.ndarray) -> np.ndarray:
+        """
+        Retrieves the interest rates for an array of maturities in a single vectorized curve evaluation.
+
+        Parameters:
+            maturities (np.ndarray): Desired maturities in years
+
+        Returns:
+            np.ndarray: Interpolated yield rates
+        """
+        return self.rate_curve.get_rate(np.asarray(maturities, dtype=float)) / 100
+
     def get_fwd_rate(self, start: float, end: float) -> float:
         """
     Computes the implied forward rate between two maturities.
@@ -187,8 +322,6 @@ class Market:
     Returns:
         float: Forward rate
         """
-        if not self.rate_curve:
-            self._fetch_yield_curves()
     
         if end <= start:
             raise ValueError("End maturity must be greater than start maturity")
@@ -211,8 +344,25 @@ class Market:
         Returns:
             float: Discount factor
         """
+        if np.ndim(maturity) != 0:
+            return self.get_discount_factors(maturity)
+        # Scalar path on Python floats: math.exp avoids the NumPy ufunc dispatch
         rate = self.get_rate(maturity)
-        return np.exp(-rate * maturity)
+        return math.exp(-rate * maturity)
+
+    def get_discount_factors(self, maturities: np.ndarray) -> np.ndarray:
+        """
+        Computes the discount factors for an array of maturities in a single vectorized pass.
+
+        Parameters:
+            maturities (np.ndarray): Desired maturities in years
+
+        Returns:
+            np.ndarray: Discount factors
+        """
+        maturities = np.asarray(maturities, dtype=float)
+        return np.exp(-self.get_rates(maturities) * maturities)
+
     def get_fwd_discount_factor(self, start: float, end: float) -> float:
         """
         Computes the forward discount factor between two future dates.
@@ -224,9 +374,6 @@ class Market:
         Returns:
             float: Forward discount factor between start and end
         """
-        if not self.rate_curve:
-            self._fetch_yield_curves()
-
         if end <= start:
             raise ValueError("End maturity must be greater than start maturity")
         if start == 0.0:
@@ -246,10 +393,12 @@ class Market:
         Returns:
             float: volatility at this point of the surface
         """
-        if not self.volatility_surface:
-            self._fetch_volatility_surface()
-        return self.volatility_surface.get_volatility(strike, maturity)
-    
+        key = (round(strike, _CACHE_DECIMALS), round(maturity, _CACHE_DECIMALS))
+        volatility = self._volatility_cache.get(key)
+        if volatility is None:
+            volatility = self._volatility_cache[key] = self.volatility_surface.get_volatility(strike, maturity)
+        return volatility
+
     def bump_volatility(self, bump: float) -> "Market":
         bumped_market = copy.deepcopy(self)
         bumped_market._fetch_volatility_surface(bump=bump)
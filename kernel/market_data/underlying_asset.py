@@ -1,5 +1,4 @@
-import pandas as pd
-import os
+from types import SimpleNamespace
 
 class UnderlyingAsset:
     """
@@ -12,6 +11,7 @@ class UnderlyingAsset:
         is_index (bool): Boolean indicating if the underlying asset is an index
         last_price (float): Last known price of the underlying asset
     """
+    __slots__ = ("name", "ticker", "isin", "is_index", "last_price")
 
     def __init__(self, name: str):
         """
@@ -27,11 +27,11 @@ class UnderlyingAsset:
         self.is_index: bool = None
         self.last_price: float = None
 
-    def load_underlying_info(self, asset_info: pd.Series):
+    def load_underlying_info(self, asset_info: SimpleNamespace):
         """
-        Load the underlying informations from the loaded file.
+        Load the underlying informations from the indexed file.
         """
-        self.ticker = str(asset_info["Ticker"].iloc[0])
-        self.isin = str(asset_info["ISIN"].iloc[0])
-        self.is_index = bool(asset_info["Is Index"].iloc[0])
-        self.last_price = float(asset_info["Last Price"].iloc[0])
+        self.ticker = asset_info.ticker
+        self.isin = asset_info.isin
+        self.is_index = asset_info.is_index
+        self.last_price = asset_info.last_price
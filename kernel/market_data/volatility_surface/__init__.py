@@ -2,4 +2,4 @@ from .abstract_volatility_surface import AbstractVolatilitySurface
 from .local_surface import LocalVolatilitySurface
 from .svi_surface import SVIVolatilitySurface
 from .ssvi_surface import SSVIVolatilitySurface
-from .enums_volatility import VolatilitySurfaceType
\ No newline at end of file
+from .enums_volatility import VolatilitySurfaceType, VOLATILITY_SURFACES, get_volatility_surface_class
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
 from kernel.market_data  import RateCurve
@@ -13,6 +14,37 @@ class AbstractVolatilitySurface(ABC):
         """
         self.option_data = option_data
 
+    def _build_market_arrays(self, spot: float) -> None:
+        """
+        Store the option market data as contiguous NumPy arrays, grouped by maturity (in order of first appearance,
+        keeping the order of the options within each maturity), so that a maturity slice is a contiguous view
+        instead of a DataFrame mask.
+
+        Parameters:
+            spot (float): spot price used for the log moneyness
+        """
+        maturity_codes, unique_maturities = pd.factorize(self.option_data["Maturity"])
+        order = np.argsort(maturity_codes, kind="stable")
+
+        self._market_maturity_codes = maturity_codes[order]
+        self._market_unique_maturities = unique_maturities.to_numpy(dtype=np.float64)
+        self._market_slice_bounds = np.searchsorted(self._market_maturity_codes, np.arange(len(unique_maturities) + 1))
+
+        self._market_strikes = self.option_data["Strike"].to_numpy(dtype=np.float64)[order]
+        self._market_maturities = self.option_data["Maturity"].to_numpy(dtype=np.float64)[order]
+        self._market_vols = self.option_data["Implied Volatility"].to_numpy(dtype=np.float64)[order]
+        self._market_log_moneyness = np.log(self._market_strikes / spot)
+
+    def _market_slice(self, index: int) -> slice:
+        """
+        Parameters:
+            index (int): position of the maturity in the unique maturities of the market data
+
+        Returns:
+            slice: bounds of the options of this maturity in the market data arrays
+        """
+        return slice(self._market_slice_bounds[index], self._market_slice_bounds[index + 1])
+
     @abstractmethod
     def calibrate_surface(self) -> None:
         """
@@ -1,12 +1,9 @@
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
 from . import AbstractVolatilitySurface
 from kernel.market_data import RateCurve
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.stats import norm
+from scipy.special import ndtr
+from typing import Union
 
 
 class LocalVolatilitySurface(AbstractVolatilitySurface):
@@ -26,6 +23,11 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         - T is the maturity
         - r is the risk-free rate
 
+    It is evaluated in its equivalent total implied variance form (Gatheral), with w(y, T) = σ_imp^2 * T
+    and y = log(K / F_T) the log forward moneyness:
+        σ_local^2(K, T) = (∂w/∂T) / (1 - (y / w) ∂w/∂y + 0.25 * (-0.25 - 1 / w + y^2 / w^2) * (∂w/∂y)^2 + 0.5 * ∂²w/∂y²)
+    where the derivatives of w are the closed-form derivatives of the SVI surface.
+
     This class provides methods to compute local volatility, visualize volatility smiles, and display 
     the local volatility surface in 3D.
 
@@ -55,6 +57,8 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         self.rate_curve = rate_curve
         self.svi_surface = svi_surface
         self.spot = svi_surface.spot
+        self._build_market_arrays(self.spot)
+        self._display_grid = None
     
     def calibrate_surface(self):
         """
@@ -62,98 +66,100 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         """
         pass
 
-    def _option_price(self, strike: float, maturity: float) -> float:
+    def _option_price(self, strike: Union[float, np.ndarray], maturity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Compute the price of a call option using the Black-Scholes formula.
 
         Parameters:
-            strike (float): Strike price of the option.
-            maturity (float): Maturity of the option in years.
+            strike (Union[float, np.ndarray]): Strike price of the option.
+            maturity (Union[float, np.ndarray]): Maturity of the option in years.
 
         Returns:
-            float: Price of the call option.
+            Union[float, np.ndarray]: Price of the call option.
         """
         S = self.spot
         sigma = self.svi_surface.get_volatility(strike, maturity)
         r = self.rate_curve.get_rate(maturity) / 100.0
 
-        d1 = (np.log(S / strike) + (r + 0.5 * sigma ** 2) * maturity) / (sigma * np.sqrt(maturity))
-        d2 = d1 - sigma * np.sqrt(maturity)
+        sigma_sqrt_T = sigma * np.sqrt(maturity)
+        discount = np.exp(-r * maturity)
+        d1 = (np.log(S / strike) + (r + 0.5 * sigma ** 2) * maturity) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
 
-        return S * norm.cdf(d1) - strike * np.exp(-r * maturity) * norm.cdf(d2)
+        # ndtr is the standard normal cdf behind norm.cdf, without the scipy.stats distribution overhead
+        return S * ndtr(d1) - strike * discount * ndtr(d2)
 
-    def _finite_difference(self, func: callable, x: float, order: int =1, delta: float = 0.05) -> float:
+    def _compounded_rate_derivative(self, maturity: np.ndarray, eps: float = 1e-4) -> np.ndarray:
         """
-        Generic finite difference method to compute the derivative of a function.
-        Can compute first and second derivatives.
+        Compute the instantaneous forward rate d(r(T) * T)/dT, i.e. the drift of the log forward moneyness.
 
         Parameters:
-            func (callable): Function to differentiate.
-            x (float): Point at which to evaluate the derivative.
-            order (int): Order of the derivative (1 or 2).
-            delta (float): Small perturbation value for finite difference.
+            maturity (np.ndarray): Maturities in years.
+            eps (float): Maturity perturbation of the central difference.
 
         Returns:
-            float: Approximated derivative at point x.
+            np.ndarray: Instantaneous forward rates at these maturities.
         """
-        eps = max(x * delta, 1e-2)
+        lower = np.maximum(maturity - eps, 0.0)
+        upper = maturity + eps
+        compounded = lambda T: self.rate_curve.get_rate(T) / 100.0 * T
+        return (compounded(upper) - compounded(lower)) / (upper - lower)
 
-        if order == 1:
-            return (func(x + eps) - func(x - eps)) / (2 * eps)
-        elif order == 2:
-            return (func(x + eps) - 2 * func(x) + func(x - eps)) / (eps ** 2)
-        else:
-            raise ValueError("Derivative order must be 1 or 2.")
-
-    def _compute_derivatives(self, strike: float, maturity: float) -> tuple:
+    def get_volatility(self, strike: Union[float, np.ndarray], maturity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
-        Compute the finite difference derivatives needed for Dupire's formula.
+        Compute the local volatility using Dupire's formula for a given strike and maturity.
+        Arrays of strikes and maturities (broadcast together) are evaluated in a single pass.
 
         Parameters:
-            strike (float): Strike price of the option.
-            maturity (float): Maturity of the option in years.
+            strike (Union[float, np.ndarray]): Strike price of the option.
+            maturity (Union[float, np.ndarray]): Maturity of the option in years.
 
         Returns:
-            tuple: Tuple containing the first derivative with respect to strike, 
-                   second derivative with respect to strike, and first derivative with respect to maturity.
+            Union[float, np.ndarray]: Local volatility for the given strike and maturity.
         """
-        f_K = lambda K: self._option_price(K, maturity)
-        f_T = lambda T: self._option_price(strike, T)
-        
-        dC_dK = self._finite_difference(f_K, strike, order=1)
-        d2C_dK2 = self._finite_difference(f_K, strike, order=2)
-        dC_dT = self._finite_difference(f_T, maturity, order=1)
-        
-        return dC_dK, d2C_dK2, dC_dT
+        is_scalar = np.ndim(strike) == 0 and np.ndim(maturity) == 0
+        strike, maturity = np.broadcast_arrays(np.asarray(strike, dtype=np.float64), np.asarray(maturity, dtype=np.float64))
 
-    def get_volatility(self, strike: float, maturity: float) -> float:
-        """
-        Compute the local volatility using Dupire's formula for a given strike and maturity.
+        # SVI derivatives are taken at fixed spot moneyness: at fixed forward moneyness y = k - r(T) * T,
+        # the maturity derivative picks up the drift of k, while the derivatives in k and y are the same
+        w, dw_dy, d2w_dy2, dw_dT = self.svi_surface.get_total_variance_derivatives(strike, maturity)
+        y = np.log(strike / self.spot) - self.rate_curve.get_rate(maturity) / 100.0 * maturity
 
-        Parameters:
-            strike (float): Strike price of the option.
-            maturity (float): Maturity of the option in years.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            numerator = dw_dT + dw_dy * self._compounded_rate_derivative(maturity)
+            denominator = 1 - y / w * dw_dy + 0.25 * (-0.25 - 1 / w + y ** 2 / w ** 2) * dw_dy ** 2 + 0.5 * d2w_dy2
+            local_vol = np.sqrt(numerator / denominator)
 
-        Returns:
-            float: Local volatility for the given strike and maturity.
+        # Fall back on the implied volatility where Dupire's formula is not defined
+        fallback = ~(denominator > 1e-8) | ~(numerator >= 0)
+        if is_scalar:
+            return self.svi_surface.get_volatility(strike[()], maturity[()]) if fallback else local_vol[()]
+
+        if fallback.any():
+            local_vol[fallback] = self.svi_surface.get_volatility(strike[fallback], maturity[fallback])
+        return local_vol
+
+    def _get_display_grid(self) -> tuple:
         """
-        dC_dK, d2C_dK2, dC_dT = self._compute_derivatives(strike, maturity)
-        r = self.rate_curve.get_rate(maturity) / 100.0
-        
-        numerator = dC_dT + r * strike * dC_dK
-        denominator = 0.5 * strike**2 * d2C_dK2
+        Build (once) the strike and maturity grid shared by the 3D displays.
 
-        if denominator <= 1e-8 or numerator < 0:
-            return self.svi_surface.get_volatility(strike, maturity)
-        
-        return np.sqrt(numerator / denominator)
+        Returns:
+            tuple: strikes axis, maturities axis, strikes meshgrid and maturities meshgrid (indexed strike x maturity).
+        """
+        if self._display_grid is None:
+            strikes = np.linspace(self.spot / 2, self.spot * 2, 50)
+            maturities = np.linspace(self.option_data["Maturity"].min(), self.option_data["Maturity"].max(), 50)
+            self._display_grid = (strikes, maturities) + tuple(np.meshgrid(strikes, maturities, indexing="ij"))
+        return self._display_grid
 
     def display_smiles(self) -> None:
         """
         Displays the local volatility smiles for all maturities in the option data.
         Each subplot corresponds to a specific maturity and shows both market data and the interpolated smile.
         """
-        unique_maturities = np.sort(self.option_data["Maturity"].unique())
+        import matplotlib.pyplot as plt
+        maturity_order = np.argsort(self._market_unique_maturities, kind="stable")
+        unique_maturities = self._market_unique_maturities[maturity_order]
         num_maturities = len(unique_maturities)
         cols = 4
         rows = (num_maturities + cols - 1) // cols
@@ -162,26 +168,24 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
 
         strikes_range = np.linspace(self.spot / 2, self.spot * 2, 500)
 
-        for i, T in enumerate(unique_maturities):
-            local_vols = []
-            for K in strikes_range:
-                try:
-                    lv = self.get_volatility(K, T)
-                except Exception:
-                    lv = np.nan
-                local_vols.append(lv * 100)  # en pourcentage
+        # Toutes les smiles (maturités x strikes) sont évaluées en un seul appel vectorisé, en pourcentage
+        with np.errstate(all="ignore"):
+            local_vols = self.get_volatility(strikes_range[None, :], unique_maturities[:, None]) * 100
+            svi_vols = self.svi_surface.get_volatility(strikes_range[None, :], unique_maturities[:, None]) * 100
+
+        moneyness = (strikes_range / self.spot) * 100
 
+        for i, T in enumerate(unique_maturities):
             ax = axes[i]
 
             # Pour comparaison, on trace aussi la smile implicite obtenue par SVI
-            svi_vols = [self.svi_surface.get_volatility(K, T) * 100 for K in strikes_range]
-            ax.plot((strikes_range / self.spot) * 100, local_vols, label="Vol locale", color="green")
-            ax.plot((strikes_range / self.spot) * 100, svi_vols, label="Vol implicite SVI", color="orange", linestyle="--")
+            ax.plot(moneyness, local_vols[i], label="Vol locale", color="green")
+            ax.plot(moneyness, svi_vols[i], label="Vol implicite SVI", color="orange", linestyle="--")
 
             # Ajouter les points de données du marché
-            market_data = self.option_data[self.option_data["Maturity"] == T]
-            market_moneyness = (market_data["Strike"] / self.spot) * 100
-            market_vols = market_data["Implied Volatility"]
+            in_slice = self._market_slice(maturity_order[i])
+            market_moneyness = (self._market_strikes[in_slice] / self.spot) * 100
+            market_vols = self._market_vols[in_slice]
             ax.scatter(market_moneyness, market_vols, color="red", label="Données marché", s=10)
 
             ax.set_title(f"Maturité : {int(T * 252)} jours", fontsize=12, fontweight="bold")
@@ -194,21 +198,16 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
             fig.delaxes(axes[j])
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Libère la figure du registre de pyplot
 
     def display_surface(self) -> None:
         """
         Display the local volatility surface in 3D.
         """
-        strikes = np.linspace(self.spot / 2, self.spot * 2, 50)
-        maturities = np.linspace(self.option_data["Maturity"].min(), self.option_data["Maturity"].max(), 50)
-        local_surface = np.zeros((len(strikes), len(maturities)))
-
-        for i, K in enumerate(strikes):
-            for j, T in enumerate(maturities):
-                try:
-                    local_surface[i, j] = self.get_volatility(K, T) * 100
-                except Exception:
-                    local_surface[i, j] = np.nan
+        import matplotlib.pyplot as plt
+        strikes, maturities, strikes_grid, maturities_grid = self._get_display_grid()
+        with np.errstate(all="ignore"):
+            local_surface = self.get_volatility(strikes_grid, maturities_grid) * 100
 
         X, Y = np.meshgrid(maturities * 252, (strikes / self.spot) * 100)
         fig = plt.figure(figsize=(12, 8))
@@ -230,21 +229,16 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         ax.grid(True, linestyle="--", alpha=0.5)
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Libère la figure du registre de pyplot
 
     def display_price_surface(self) -> None:
         """
         Display the price surface of calls in 3D.
         """
-        strikes = np.linspace(self.spot / 2, self.spot * 2, 50)
-        maturities = np.linspace(self.option_data["Maturity"].min(), self.option_data["Maturity"].max(), 50)
-        price_surface = np.zeros((len(strikes), len(maturities)))
-
-        for i, K in enumerate(strikes):
-            for j, T in enumerate(maturities):
-                try:
-                    price_surface[i, j] = self._option_price(K, T)
-                except Exception:
-                    price_surface[i, j] = np.nan
+        import matplotlib.pyplot as plt
+        strikes, maturities, strikes_grid, maturities_grid = self._get_display_grid()
+        with np.errstate(all="ignore"):
+            price_surface = self._option_price(strikes_grid, maturities_grid)
 
         X, Y = np.meshgrid(maturities * 252, (strikes / self.spot) * 100)
         fig = plt.figure(figsize=(12, 8))
@@ -253,7 +247,7 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         
         market_strikes = (self.option_data["Strike"] / self.spot) * 100
         market_maturities = self.option_data["Maturity"] * 252
-        market_prices = [self._option_price(row["Strike"], row["Maturity"]) for _, row in self.option_data.iterrows()]
+        market_prices = self._option_price(self.option_data["Strike"].to_numpy(), self.option_data["Maturity"].to_numpy())
         ax.scatter(market_maturities, market_strikes, market_prices, color="red", label="Options de marché", s=20)
 
         cbar = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=10)
@@ -266,3 +260,4 @@ class LocalVolatilitySurface(AbstractVolatilitySurface):
         ax.grid(True, linestyle="--", alpha=0.5)
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Libère la figure du registre de pyplot
@@ -1,12 +1,10 @@
+import math
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
-import matplotlib.pyplot as plt
 from scipy.optimize import minimize
-import seaborn as sns
-from scipy.interpolate import interp1d
 from kernel.market_data import RateCurve
 from . import AbstractVolatilitySurface
+from typing import Union
 
 
 class SSVIVolatilitySurface(AbstractVolatilitySurface):
@@ -23,6 +21,7 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         self.rate_curve = rate_curve
 
         self.spot = option_data["Spot"].values[0]
+        self._build_market_arrays(self.spot)
         self.ssvi_params = None
         self.ssvi_ATM_params = None
         self.is_calibrated = False
@@ -57,10 +56,61 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
             np.ndarray[float]: total variance
         """
         rho, eta, gamma = ssvi_params
-        phi = lambda theta: eta * theta ** (-gamma)
+        phi = eta * atm_variance ** (-gamma)  # phi(theta), evaluated once for both terms
+
+        return 0.5 * atm_variance * ( 1 + rho * phi * k + np.sqrt((phi * k + rho)**2 + (1 - rho **2)))
+
+    @staticmethod
+    def _ssvi_atm_variance_jacobian(maturity: np.ndarray[float], ssvi_atm_params: np.ndarray[float]) -> np.ndarray[float]:
+        """
+        Derivatives of the SSVI ATM total variance with respect to its parameters.
+
+        Parameters:
+            maturity (np.ndarray[float]): maturities in years
+            ssvi_atm_params (np.ndarray[float]): SSVI ATM variance parametrization parameters
+
+        Returns:
+            np.ndarray[float]: derivatives with respect to (kappa, v0, v_inf), of shape (3, len(maturity))
+        """
+        kappa, v0, v_inf = ssvi_atm_params
+        decay = np.exp(-kappa * maturity)
+        g = (1 - decay) / kappa
+        dg_dkappa = (kappa * maturity * decay - (1 - decay)) / kappa ** 2
+
+        return np.stack([dg_dkappa * maturity ** 2 * (v0 - v_inf), g * maturity ** 2, (1 - g * maturity) * maturity])
+
+    @staticmethod
+    def _ssvi_total_variance_and_jacobian(k: np.ndarray[float], atm_variance: np.ndarray[float], ssvi_params: np.ndarray[float],
+                                          log_atm_variance: np.ndarray[float] = None) -> tuple:
+        """
+        SSVI total variance and its derivatives with respect to its parameters, sharing phi(theta) and the square root term.
+        phi(theta) = eta * theta^(-gamma) is evaluated as eta * exp(-gamma * log(theta)) so that log(theta) can be precomputed.
+
+        Parameters:
+            k (np.ndarray[float]): log moneyness
+            atm_variance (np.ndarray[float]): ATM variance for the maturity of each log moneyness
+            ssvi_params (np.ndarray[float]): SSVI parameters
+            log_atm_variance (np.ndarray[float]): log of the ATM variance, computed from atm_variance if not given
+
+        Returns:
+            tuple: total variance and its derivatives with respect to (rho, eta, gamma), of shape (3, len(k))
+        """
+        rho, eta, gamma = ssvi_params
+        if log_atm_variance is None:
+            log_atm_variance = np.log(atm_variance)
+
+        phi = eta * np.exp(-gamma * log_atm_variance)
+        phi_k = phi * k
+        root = np.sqrt((phi_k + rho) ** 2 + (1 - rho ** 2))
+        half_atm_variance = 0.5 * atm_variance
+
+        total_variance = half_atm_variance * (1 + rho * phi_k + root)
+        dw_drho = half_atm_variance * (phi_k + phi_k / root)
+        dw_dphi = half_atm_variance * (rho * k + (phi_k + rho) * k / root)
+
+        # phi = eta * theta^(-gamma) : dphi/deta = phi / eta, dphi/dgamma = -phi * log(theta)
+        return total_variance, np.stack([dw_drho, dw_dphi * phi / eta, -dw_dphi * phi * log_atm_variance])
 
-        return 0.5 * atm_variance * ( 1 + rho * phi(atm_variance) * k + np.sqrt((phi(atm_variance) * k + rho)**2 + (1 - rho **2)))
-    
     def _get_market_atm_variance(self, maturity: float) -> float:
         """
         Get the ATM variance for a given maturity from the option data.
@@ -73,19 +123,22 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         Returns:
             float: ATM variance
         """
-        # Filter the option data for the given maturity
-        option_slice = self.option_data[self.option_data["Maturity"] == maturity]
-        if option_slice.empty:
+        # Slice of the market data arrays for the given maturity
+        index = np.flatnonzero(self._market_unique_maturities == maturity)
+        if index.size == 0:
             raise ValueError(f"No option data available for maturity {maturity}")
+        in_slice = self._market_slice(index[0])
+        strikes = self._market_strikes[in_slice]
+        vols = self._market_vols[in_slice]
 
         # If an ATM option is available, use its implied volatility
-        atm_option = option_slice[option_slice["Strike"] == self.spot]
-        if not atm_option.empty:
-            return maturity * atm_option["Implied Volatility"] ** 2
+        is_atm = strikes == self.spot
+        if is_atm.any():
+            return maturity * vols[is_atm][0] ** 2
         
         # Otherwise, interpolate the ATM variance from the option slice data
         else:
-            atm_vol = np.interp(self.spot, option_slice["Strike"].values, option_slice["Implied Volatility"].values)
+            atm_vol = np.interp(self.spot, strikes, vols)
             return maturity * atm_vol ** 2
     
     def _get_atm_variance(self, maturity: float) -> float:
@@ -103,9 +156,9 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         
         return self._ssvi_atm_variance(maturity, self.ssvi_ATM_params)
     
-    def _ssvi_atm_cost_function(self, ssvi_atm_params: np.ndarray[float], maturities: np.ndarray[float], implied_ATM_variance: np.ndarray[float]) -> float:
+    def _ssvi_atm_cost_function(self, ssvi_atm_params: np.ndarray[float], maturities: np.ndarray[float], implied_ATM_variance: np.ndarray[float]) -> tuple:
         """
-        Cost function for the SSVI ATM calibration.
+        Cost function for the SSVI ATM calibration, with its analytic gradient.
         The calibration is done by minimizing the mean squared error between the market implied volatility and the SSVI model implied volatility.
 
         Parameters:
@@ -114,52 +167,55 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
             implied_ATM_variance (np.ndarray[float]): market implied ATM variance
 
         Returns:
-            float: mean squared error between the market implied volatility and the SSVI model implied volatility for ATM options
+            tuple: mean squared error between the market implied volatility and the SSVI model implied volatility for ATM options, and its gradient
         """
-        ssvi_ATM_variance = self._ssvi_atm_variance(maturities, ssvi_atm_params)
+        residuals = implied_ATM_variance - self._ssvi_atm_variance(maturities, ssvi_atm_params)
+        jacobian = self._ssvi_atm_variance_jacobian(maturities, ssvi_atm_params)
 
-        return np.mean((implied_ATM_variance - ssvi_ATM_variance) ** 2)
+        return np.mean(residuals ** 2), -2 * (jacobian @ residuals) / residuals.size
     
-    def _ssvi_objective_function(self, ssvi_params: np.ndarray[float], option_data: pd.DataFrame) -> float:
+    def _get_calibration_arrays(self) -> tuple:
+        """
+        Precompute, once per calibration, the flat inputs of the SSVI objective function from the market data arrays.
+        The ATM variance only depends on the ATM parameters already calibrated, so it (and its log) does not change between optimizer iterations.
+
+        Returns:
+            tuple: log moneyness, ATM variance, log ATM variance and market total variance of each option
+        """
+        atm_variance = self._get_atm_variance(self._market_unique_maturities)
+        market_total_variance = (self._market_vols ** 2) * self._market_maturities
+
+        return (self._market_log_moneyness, atm_variance[self._market_maturity_codes],
+                np.log(atm_variance)[self._market_maturity_codes], market_total_variance)
+
+    def _ssvi_objective_function(self, ssvi_params: np.ndarray[float], k: np.ndarray[float], atm_variance: np.ndarray[float],
+                                 log_atm_variance: np.ndarray[float], market_total_variance: np.ndarray[float]) -> tuple:
         """
-        Objective function for the SSVI calibration.
+        Objective function for the SSVI calibration, with its analytic gradient.
         The calibration is done by minimizing the mean squared error between the market implied volatility and the SSVI model implied volatility.
-        For each maturity, the ATM variance is computed and used to compute the SSVI implied volatility.
+        The SSVI total variance of all options is evaluated at once, each with the precomputed ATM variance of its maturity.
 
         Parameters:
             ssvi_params (np.ndarray[float]): SSVI parameters
-            option_data (pd.DataFrame): option market data, must contain the following columns : 'Strike', 'Spot', 'Maturity', 'Implied Volatility'
+            k (np.ndarray[float]): log moneyness of each option
+            atm_variance (np.ndarray[float]): ATM variance of the maturity of each option
+            log_atm_variance (np.ndarray[float]): log of the ATM variance of each option
+            market_total_variance (np.ndarray[float]): market total implied variance of each option
 
         Returns:
-            float: mean squared error between the market implied volatility and the SSVI model implied volatility
+            tuple: mean squared error between the market implied volatility and the SSVI model implied volatility, and its gradient
         """
-        ssvi_total_variance = []
-        market_total_variance = []
-        for maturity in option_data["Maturity"].unique():
-            # Filter the option data for the given maturity
-            slice_options = option_data[option_data["Maturity"] == maturity]
-
-            # For each maturity, compute the ATM variance and the SSVI implied volatility
-            atm_variance = self._get_atm_variance(maturity)
-            
-            k = np.log(slice_options["Strike"].values / self.spot)
-            ssvi_total_variance.append(self._ssvi_total_variance(k, atm_variance, ssvi_params))
-
-            # Also compute the market data total implied variance
-            market_total_variance.append((slice_options["Implied Volatility"].values ** 2) * maturity)
+        ssvi_total_variance, jacobian = self._ssvi_total_variance_and_jacobian(k, atm_variance, ssvi_params, log_atm_variance)
+        residuals = market_total_variance - ssvi_total_variance
 
-        # Flatten the list of total variance arrays and market total variance arrays
-        ssvi_total_variance = np.concatenate(ssvi_total_variance)
-        market_total_variance = np.concatenate(market_total_variance)
-
-        return np.mean((market_total_variance - ssvi_total_variance) ** 2)
+        return np.mean(residuals ** 2), -2 * (jacobian @ residuals) / residuals.size
 
     def calibrate_atm_variance(self):
         """
         Calibrate the ATM variance using the option data.
         This function uses the least squares method to minimize the difference between the market implied volatility and the SSVI model implied volatility at ATM.
         """
-        maturities = self.option_data["Maturity"].unique()
+        maturities = self._market_unique_maturities
         atm_market_variance = np.array([self._get_market_atm_variance(maturity) for maturity in maturities])
 
         # Calibrate the ATM variance wit ATM options
@@ -169,7 +225,9 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
             self._ssvi_atm_cost_function,
             initial_values,
             args=(maturities, atm_market_variance),
-            method="Nelder-Mead",
+            method="L-BFGS-B",
+            jac=True,
+            bounds=[(1e-6, None), (None, None), (None, None)],  # kappa > 0
         )
         
         if res.success:
@@ -191,11 +249,16 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         # Initial guess for the SSVI parameters [rho, eta, gamma]
         initial_values = [0.1, 0.1, 0.1]
 
+        # Objective inputs are built once instead of at every optimizer iteration
+        k, atm_variance, log_atm_variance, market_total_variance = self._get_calibration_arrays()
+
         res = minimize(
             self._ssvi_objective_function,
             initial_values,
-            args=(self.option_data),
-            method="Nelder-Mead",
+            args=(k, atm_variance, log_atm_variance, market_total_variance),
+            method="L-BFGS-B",
+            jac=True,
+            bounds=[(-0.999, 0.999), (1e-6, None), (1e-6, 1 - 1e-6)],  # |rho| < 1, eta > 0, 0 < gamma < 1
         )
 
         if res.success:
@@ -204,23 +267,25 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         else:
             raise Exception(f"SSVI calibration failed : {res.message}")
         
-    def get_volatility(self, strike: float, maturity: float) -> float:
+    def get_volatility(self, strike: Union[float, np.ndarray], maturity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Get the volatility interpolated by the SSVI model for a given strike and maturity.
+        Arrays of strikes and maturities are broadcast together and evaluated in a single call.
 
         Parameters:
-            strike (float): strike price
-            maturity (float): maturity in years
+            strike (Union[float, np.ndarray]): strike price
+            maturity (Union[float, np.ndarray]): maturity in years
 
         Returns:
-            float: implied volatility
+            Union[float, np.ndarray]: implied volatility
         """
         if self.ssvi_params is None:
             raise ValueError("SSVI parameters are not calibrated. Please call calibrate_surface() first.")
 
         atm_variance = self._get_atm_variance(maturity)
 
-        k = np.log(strike / self.spot)
+        # Scalar strikes go through math.log, without the NumPy ufunc dispatch
+        k = math.log(strike / self.spot) if isinstance(strike, (int, float)) else np.log(strike / self.spot)
         ssvi_total_variance = self._ssvi_total_variance(k, atm_variance, self.ssvi_params)
 
         return np.sqrt(ssvi_total_variance / maturity) / 100
@@ -230,11 +295,12 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         Displays the SSVI volatility smiles for all maturities in the option data.
         Each subplot corresponds to a specific maturity and shows both market data and the interpolated smile.
         """
+        import matplotlib.pyplot as plt
         if self.ssvi_params is None:
             raise ValueError("SSVI parameters are not calibrated. Please call calibrate_surface() first.")
 
         # Get unique maturities
-        unique_maturities = self.option_data["Maturity"].unique()
+        unique_maturities = self._market_unique_maturities
         num_maturities = len(unique_maturities)
 
         # Create subplots
@@ -243,23 +309,25 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         fig, axes = plt.subplots(rows, cols, figsize=(15, 4 * rows))
         axes = axes.flatten()
 
+        # Strikes of the smiles and their moneyness are the same for every maturity
+        spot = self.spot
+        strikes = np.linspace(spot / 2, spot * 2, 500)
+        moneyness = (strikes / self.spot) * 100
+
         for i, maturity in enumerate(unique_maturities):
             ax = axes[i]
 
             # Extract option data for the current maturity
-            option_data = self.option_data[self.option_data["Maturity"] == maturity]
-            spot = self.option_data["Spot"].values[0]
-            strikes = np.linspace(spot / 2, spot * 2, 500)
+            in_slice = self._market_slice(i)
 
             # Get the smile
-            vol_impl = [self.get_volatility(strike, maturity) * 100 for strike in strikes]
+            vol_impl = self.get_volatility(strikes, maturity) * 100
 
             # Plot market data
-            ax.scatter(option_data['Strike']*100/self.spot, option_data['Implied Volatility'], color='blue', label='Market Data', s=20)
+            ax.scatter(self._market_strikes[in_slice]*100/self.spot, self._market_vols[in_slice], color='blue', label='Market Data', s=20)
 
             # Plot interpolated smile
-            strikes = (strikes / self.spot) * 100
-            ax.plot(strikes, vol_impl, label='Interpolated Smile', color='orange')
+            ax.plot(moneyness, vol_impl, label='Interpolated Smile', color='orange')
 
             # Set labels and title
             ax.set_title(f"Maturity: {int(maturity*252)} days", fontsize=12, fontweight='bold')
@@ -274,24 +342,24 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Release the figure from the pyplot registry
 
     
     def display_surface(self) -> None:
         """
         Displays the SSVI volatility surface.
         """
+        import matplotlib.pyplot as plt
         if self.ssvi_params is None:
             raise ValueError("SSVI parameters are not calibrated. Please call calibrate_surface() first.")
 
-        spot = self.option_data["Spot"].values[0]
+        spot = self.spot
         strikes = np.linspace(spot / 2, spot * 2, 50)
-        maturities = np.linspace(min(self.option_data["Maturity"]), max(self.option_data["Maturity"]), 50)
+        maturities = np.linspace(self.option_data["Maturity"].min(), self.option_data["Maturity"].max(), 50)
 
-        # Get the surface
-        vol_surface = np.zeros((len(strikes), len(maturities)))
-        for i, strike in enumerate(strikes):
-            for j, maturity in enumerate(maturities):
-                vol_surface[i, j] = self.get_volatility(strike, maturity) * 100
+        # Get the surface, evaluated on the whole (strikes x maturities) grid at once :
+        # strikes and maturities are broadcast so that the maturity terms are only computed once per maturity
+        vol_surface = self.get_volatility(strikes[:, None], maturities[None, :]) * 100
 
         maturities = maturities * 252
         strikes = (strikes / self.spot) * 100
@@ -315,4 +383,5 @@ class SSVIVolatilitySurface(AbstractVolatilitySurface):
         ax.legend(fontsize=10)
 
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        plt.show()
+        plt.close(fig)  # Release the figure from the pyplot registry
\ No newline at end of file
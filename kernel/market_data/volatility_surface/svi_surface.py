@@ -1,10 +1,9 @@
+import math
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
-import matplotlib.pyplot as plt
 from scipy.optimize import minimize
-import seaborn as sns
-from scipy.interpolate import interp1d
+from scipy.interpolate import BSpline, make_interp_spline
+from typing import Union
 from kernel.market_data import RateCurve
 from . import AbstractVolatilitySurface
 
@@ -46,12 +45,18 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
         """
         self.option_data = option_data
         self.spot = option_data["Spot"].values[0]
+        self._build_market_arrays(self.spot)
         self.svi_params = None
         self.rate_curve = rate_curve
-        self.svi_params_by_maturity = {}
         self.interpolators = {}
         self.is_calibrated = False
 
+        # Sorted slice maturities, their parameters (n_slices, 5) and the joint cubic spline of the five parameters
+        self._slice_maturities = None
+        self._slice_params = None
+        self._params_spline = None
+        self._params_spline_dT = None
+
     @staticmethod
     def svi_total_variance(k: np.ndarray[float], svi_params: np.ndarray[float]) -> float:
         """
@@ -67,28 +72,22 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
         a, b, rho, m, sigma = svi_params
         return a + b * (rho * (k - m) + np.sqrt((k - m) ** 2 + sigma ** 2))
 
-    def compute_weighting_vega(self, spot: float, maturities: np.ndarray[float],
-                               vols: np.ndarray[float], strikes: np.ndarray[float]) -> np.ndarray[float]:
+    @staticmethod
+    def svi_total_variance_jacobian(k: np.ndarray[float], svi_params: np.ndarray[float]) -> np.ndarray[float]:
         """
-        Compute vegas to weight the cost function in order to fit better the ATM options.
+        Defines the derivatives of the SVI total implied variance w(k) with respect to its five parameters.
 
         Parameters:
-            spot (np.ndarray[float]): market data spot
-            maturities (np.ndarray[float]): market data maturities
-            vols (np.ndarray[float]): market data Implied Volatility from the option data historic
-            strikes (np.ndarray[float]): market data strikes
+            k (np.ndarray[float]): log moneyness
+            svi_params (np.ndarray[float]): five parameters of the SVI [a, b, p, m, sigma]
 
         Returns:
-            np.ndarray[float]: options vega
+            np.ndarray[float]: derivatives with respect to [a, b, p, m, sigma], of shape (5, len(k))
         """
-        try:
-            r = np.array([self.rate_curve.get_rate(t) for t in maturities])/100
-        except Exception:
-            r = 0
-
-        vols = vols / 100
-        d1 = (np.log(spot / strikes) + (r + 0.5 * vols ** 2) * maturities) / (vols * np.sqrt(maturities))
-        return spot * norm.pdf(d1) * np.sqrt(maturities)
+        a, b, rho, m, sigma = svi_params
+        x = k - m
+        root = np.sqrt(x ** 2 + sigma ** 2)
+        return np.stack([np.ones_like(x), rho * x + root, b * x, -b * (rho + x / root), b * sigma / root])
 
     def cost_function_svi(self, svi_params: np.ndarray[float], log_moneyness : np.ndarray[float],
                           maturities: np.ndarray[float], market_implied_vol: np.ndarray[float],
@@ -112,97 +111,171 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
         market_total_variance = (market_implied_vol ** 2) * maturities
 
         # SVI total implied variance
-        SVI_total_variance = np.array(self.svi_total_variance(log_moneyness, svi_params))
+        SVI_total_variance = self.svi_total_variance(log_moneyness, svi_params)
 
         return float(np.mean((SVI_total_variance - market_total_variance) ** 2))
 
+    def _cost_function_svi_with_gradient(self, svi_params: np.ndarray[float], log_moneyness : np.ndarray[float],
+                                         market_total_variance: np.ndarray[float]) -> tuple:
+        """
+        Same MSE cost function as cost_function_svi, returned together with its analytic gradient for the optimizer.
+        The market total implied variance does not depend on the parameters and is computed once per slice by the caller.
+
+        Parameters:
+            svi_params (np.ndarray[float]): given set of svi parameters [a, b, p, m, sigma]
+            log_moneyness (np.ndarray[float]): market data log moneyness
+            market_total_variance (np.ndarray[float]): market data total implied variance
+
+        Returns:
+            tuple: Mean Squared Error between market data and SVI total implied variance, and its gradient
+        """
+        residuals = self.svi_total_variance(log_moneyness, svi_params) - market_total_variance
+        jacobian = self.svi_total_variance_jacobian(log_moneyness, svi_params)
+
+        return float(np.mean(residuals ** 2)), 2 * (jacobian @ residuals) / residuals.size
+
     def calibrate_surface(self) -> None:
         """
         Calibrate the volatility surface by fitting SVI parameters for each maturity slice,
         then interpolate the parameters across maturities.
         """
-        unique_maturities = self.option_data["Maturity"].unique()
-        self.svi_params_by_maturity = {}
-
-        for maturity in unique_maturities:
-            # Filter data for the current maturity
-            slice_data = self.option_data[self.option_data["Maturity"] == maturity]
-            log_moneyness = np.log(slice_data['Strike'].values / self.spot)
-            market_vols = slice_data["Implied Volatility"].values / 100
-            strikes = slice_data["Strike"].values
-
-            # Compute vega weights
-            vega = self.compute_weighting_vega(self.spot,
-                                               slice_data["Maturity"].values,
-                                               market_vols,
-                                               strikes)
-
-            # Initial parameters and bounds
-            initial_params = np.array([0.1, 0.1, 0.0, 0.0, 0.1])
-            bounds = [(0, None), (0, None), (-1, 1), (None, None), (0, None)]
+        unique_maturities = self._market_unique_maturities
+        order = np.argsort(unique_maturities, kind="stable")
+
+        # Slices are stored by increasing maturity: one row of five SVI parameters per maturity
+        self._slice_maturities = np.ascontiguousarray(unique_maturities[order], dtype=np.float64)
+        self._slice_params = np.empty((order.size, 5), dtype=np.float64)
+
+        # Slices are calibrated by increasing maturity, each one starting from the parameters of the previous slice
+        initial_params = np.array([0.1, 0.1, 0.0, 0.0, 0.1])
+        bounds = [(0, None), (0, None), (-1, 1), (None, None), (0, None)]
+
+        for row, i in enumerate(order):
+            # Market data of the current maturity, as contiguous views of the arrays built at initialization
+            in_slice = self._market_slice(i)
+            log_moneyness = self._market_log_moneyness[in_slice]
+            market_total_variance = ((self._market_vols[in_slice] / 100) ** 2) * self._market_maturities[in_slice]
 
             # Perform optimization
-            result = minimize(self.cost_function_svi, initial_params, method="L-BFGS-B", bounds=bounds,
-                              args=(log_moneyness, slice_data["Maturity"].values, market_vols, vega))
+            result = minimize(self._cost_function_svi_with_gradient, initial_params, method="L-BFGS-B", bounds=bounds, jac=True,
+                              args=(log_moneyness, market_total_variance))
 
             if result.success:
-                self.svi_params_by_maturity[maturity] = result.x
+                self._slice_params[row] = result.x
                 self.is_calibrated = True
+                initial_params = result.x
             else:
-                raise Exception(f"SVI calibration failed for maturity {maturity}: {result.message}")
+                raise Exception(f"SVI calibration failed for maturity {unique_maturities[i]}: {result.message}")
 
         # Interpolate SVI parameters across maturities
-        self._interpolate_parameters(unique_maturities)
+        self._interpolate_parameters()
 
-    def _interpolate_parameters(self, maturities: np.ndarray) -> None:
+    def _interpolate_parameters(self) -> None:
         """
         Interpolate SVI parameters across maturities.
         """
-        svi_params_array = np.array([self.svi_params_by_maturity[m] for m in maturities])
+        # A single cubic spline (not-a-knot, as interp1d kind='cubic') interpolates the five parameters at once
+        self._params_spline = make_interp_spline(self._slice_maturities, self._slice_params, k=3, check_finite=False)
+
+        # Per-parameter interpolators share the knots and coefficients of the spline above, without solving again
         self.interpolators = {
-            i: interp1d(maturities, svi_params_array[:, i], kind='cubic', fill_value="extrapolate")
+            i: BSpline(self._params_spline.t, self._params_spline.c[:, i], self._params_spline.k)
             for i in range(5)
         }
+        self._params_spline_dT = self._params_spline.derivative()
 
-    def get_volatility(self, strike: float, maturity: float) -> float:
+    def get_volatility(self, strike: Union[float, np.ndarray], maturity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Get the volatility interpolated by the volatility surface at this specific point (Strike * Maturity).
+        Arrays of strikes and maturities (broadcast together) are evaluated in a single pass.
 
         Parameters:
-            strike (float): strike price
-            maturity (float): maturity in years
+            strike (Union[float, np.ndarray]): strike price
+            maturity (Union[float, np.ndarray]): maturity in years
 
         Returns:
-            float: implied volatility
+            Union[float, np.ndarray]: implied volatility
         """
-        if not self.interpolators:
+        if self._params_spline is None:
             raise Exception("SVI surface not calibrated yet!")
 
         # Handle flat extrapolation for maturities outside the calibrated range
-        min_maturity = min(self.svi_params_by_maturity.keys())
-        max_maturity = max(self.svi_params_by_maturity.keys())
+        if np.ndim(maturity) == 0:
+            if maturity < self._slice_maturities[0]:
+                interpolated_params = self._slice_params[0]
+            elif maturity > self._slice_maturities[-1]:
+                interpolated_params = self._slice_params[-1]
+            else:
+                interpolated_params = self._params_spline(maturity)
 
-        if maturity < min_maturity:
-            interpolated_params = np.array([self.svi_params_by_maturity[min_maturity][i] for i in range(5)])
-        elif maturity > max_maturity:
-            interpolated_params = np.array([self.svi_params_by_maturity[max_maturity][i] for i in range(5)])
+            # Scalar point: the log is taken on a Python float and the five parameters are used as they are
+            if isinstance(strike, (int, float)):
+                total_variance = self.svi_total_variance(math.log(strike / self.spot), interpolated_params)
+                return np.sqrt(total_variance / maturity)
         else:
-            interpolated_params = np.array([self.interpolators[i](maturity) for i in range(5)])
+            maturity = np.asarray(maturity, dtype=np.float64)
+            interpolated_params = self._interpolate_params(maturity)
 
         log_moneyness = np.log(strike / self.spot)
-        total_variance = self.svi_total_variance(log_moneyness, interpolated_params)
+        total_variance = self.svi_total_variance(log_moneyness, np.moveaxis(interpolated_params, -1, 0))
         return np.sqrt(total_variance / maturity)
 
+    def _interpolate_params(self, maturity: np.ndarray) -> np.ndarray:
+        """
+        Interpolates the five SVI parameters for an array of maturities, flat outside the calibrated range.
+
+        Parameters:
+            maturity (np.ndarray): maturities in years
+
+        Returns:
+            np.ndarray: SVI parameters [a, b, p, m, sigma] along the last axis
+        """
+        interpolated_params = self._params_spline(maturity)
+        interpolated_params = np.where((maturity < self._slice_maturities[0])[..., None], self._slice_params[0], interpolated_params)
+        return np.where((maturity > self._slice_maturities[-1])[..., None], self._slice_params[-1], interpolated_params)
+
+    def get_total_variance_derivatives(self, strike: np.ndarray, maturity: np.ndarray) -> tuple:
+        """
+        Computes the SVI total implied variance and its closed-form derivatives, used by the local volatility.
+        The maturity derivative goes through the derivative of the parameters cubic splines
+        (zero outside the calibrated range where the parameters are flat).
+
+        Parameters:
+            strike (np.ndarray): strike prices
+            maturity (np.ndarray): maturities in years
+
+        Returns:
+            tuple: w, ∂w/∂k, ∂²w/∂k² and ∂w/∂T at fixed log moneyness k = log(K / S)
+        """
+        if self._params_spline is None:
+            raise Exception("SVI surface not calibrated yet!")
+
+        maturity = np.asarray(maturity, dtype=np.float64)
+        a, b, rho, m, sigma = np.moveaxis(self._interpolate_params(maturity), -1, 0)
+        in_range = (maturity >= self._slice_maturities[0]) & (maturity <= self._slice_maturities[-1])
+        da, db, drho, dm, dsigma = np.moveaxis(self._params_spline_dT(maturity) * in_range[..., None], -1, 0)
+
+        u = np.log(strike / self.spot) - m
+        root = np.sqrt(u ** 2 + sigma ** 2)
+        total_variance = a + b * (rho * u + root)
+        dw_dk = b * (rho + u / root)
+        d2w_dk2 = b * sigma ** 2 / root ** 3
+
+        # Chain rule through the maturity dependence of each parameter
+        dw_dT = da + db * (rho * u + root) + drho * b * u - dm * dw_dk + dsigma * b * sigma / root
+        return total_variance, dw_dk, d2w_dk2, dw_dT
+
     def display_smiles(self) -> None:
         """
         Displays the SVI volatility smiles for all maturities in the option data.
         Each subplot corresponds to a specific maturity and shows both market data and the interpolated smile.
         """
+        import matplotlib.pyplot as plt
         if not self.interpolators:
             raise Exception("SVI surface not calibrated yet!")
 
         # Get unique maturities
-        unique_maturities = self.option_data["Maturity"].unique()
+        unique_maturities = self._market_unique_maturities
         num_maturities = len(unique_maturities)
 
         # Create subplots
@@ -211,23 +284,25 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
         fig, axes = plt.subplots(rows, cols, figsize=(15, 4 * rows))
         axes = axes.flatten()
 
+        # Strikes of the smiles and their moneyness are the same for every maturity
+        spot = self.spot
+        strikes = np.linspace(spot / 2, spot * 2, 500)
+        moneyness = (strikes / self.spot) * 100
+
         for i, maturity in enumerate(unique_maturities):
             ax = axes[i]
 
             # Extract option data for the current maturity
-            option_data = self.option_data[self.option_data["Maturity"] == maturity]
-            spot = self.option_data["Spot"].values[0]
-            strikes = np.linspace(spot / 2, spot * 2, 500)
+            in_slice = self._market_slice(i)
 
             # Get the smile
-            vol_impl = [self.get_volatility(strike, maturity) * 100 for strike in strikes]
+            vol_impl = self.get_volatility(strikes, maturity) * 100
 
             # Plot market data
-            ax.scatter(option_data['Strike']*100/self.spot, option_data['Implied Volatility'], color='blue', label='Market Data', s=20)
+            ax.scatter(self._market_strikes[in_slice]*100/self.spot, self._market_vols[in_slice], color='blue', label='Market Data', s=20)
 
             # Plot interpolated smile
-            strikes = (strikes / self.spot) * 100
-            ax.plot(strikes, vol_impl, label='Interpolated Smile', color='orange')
+            ax.plot(moneyness, vol_impl, label='Interpolated Smile', color='orange')
 
             # Set labels and title
             ax.set_title(f"Maturity: {int(maturity*252)} days", fontsize=12, fontweight='bold')
@@ -242,24 +317,24 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Release the figure from the pyplot registry
 
     def display_surface(self) -> None:
         """
         Displays the SVI volatility surface.
         """
+        import matplotlib.pyplot as plt
         if not self.interpolators:
             raise Exception("SVI surface not calibrated yet!")
 
-        spot = self.option_data["Spot"].values[0]
+        spot = self.spot
         strikes = np.linspace(spot / 2, spot * 2, 100)
-        maturities = np.linspace(min(self.option_data["Maturity"]), max(self.option_data["Maturity"]), 100)
-
-        # Get the surface
-        vol_surface = np.zeros((len(strikes), len(maturities)))
-        for i, strike in enumerate(strikes):
-            for j, maturity in enumerate(maturities):
-                vol_surface[i, j] = self.get_volatility(strike, maturity) * 100
-                
+        maturities = np.linspace(self.option_data["Maturity"].min(), self.option_data["Maturity"].max(), 100)
+
+        # Get the surface, evaluated on the whole (strikes x maturities) grid at once :
+        # strikes and maturities are broadcast so that the maturity terms are only computed once per maturity
+        vol_surface = self.get_volatility(strikes[:, None], maturities[None, :]) * 100
+
         maturities = maturities * 252
         strikes = (strikes / self.spot) * 100
         X, Y = np.meshgrid(maturities, strikes)
@@ -283,3 +358,4 @@ class SVIVolatilitySurface(AbstractVolatilitySurface):
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)  # Release the figure from the pyplot registry
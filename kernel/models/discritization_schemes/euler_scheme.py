@@ -1,45 +1,72 @@
 import numpy as np
 from ..stochastic_processes.stochastic_process import StochasticProcess,OneFactorStochasticProcess,TwoFactorStochasticProcess
+from .path_reducer import PathReducer
 
 class EulerScheme:
-    
-    def simulate_paths(self, process: StochasticProcess, nb_paths: int, seed: int = 4012) -> np.ndarray:
+
+    def simulate_paths(self, process: StochasticProcess, nb_paths: int, seed: int = 4012, antithetic: bool = False) -> np.ndarray:
         if isinstance(process, OneFactorStochasticProcess):
-            return self._simulate_one_factor(process, nb_paths, seed)
+            return self._simulate_one_factor(process, nb_paths, seed, antithetic)
         elif isinstance(process, TwoFactorStochasticProcess):
-            return self._simulate_two_factor(process, nb_paths, seed)
+            return self._simulate_two_factor(process, nb_paths, seed, antithetic)
         else:
             raise NotImplementedError("Only OneFactor or TwoFactor processes are supported.")
 
-    def _simulate_one_factor(self, process: OneFactorStochasticProcess, nb_paths: int, seed: int) -> np.ndarray:
-        paths = np.zeros((nb_paths, process.nb_steps + 1))
-        S = np.zeros((nb_paths, process.nb_steps + 1))
+    def simulate_reduced_paths(self, process: StochasticProcess, nb_paths: int, reducer: PathReducer, seed: int = 4012,
+                               antithetic: bool = False) -> dict:
+        """
+        Simulates the paths without storing them: each simulated step is fed to the reducer
+        so that only the reductions requested by the product (final prices, running extremum ...) are kept in memory.
 
-        paths[:, 0] = process.S0
+        Parameters:
+            process (StochasticProcess): The process to simulate
+            nb_paths (int): The number of paths to simulate
+            reducer (PathReducer): The reducer updated with the prices of each step
+            seed (int): The seed for the random number generator. Default is 4012
+            antithetic (bool): Whether the paths are drawn by antithetic pairs. Default is False
+
+        Returns:
+            dict: The reduced buffers of the simulated paths, indexed by reduction name
+        """
+        if isinstance(process, OneFactorStochasticProcess):
+            steps = self._one_factor_steps(process, nb_paths, seed, antithetic)
+        elif isinstance(process, TwoFactorStochasticProcess):
+            steps = self._two_factor_steps(process, nb_paths, seed, antithetic)
+        else:
+            raise NotImplementedError("Only OneFactor or TwoFactor processes are supported.")
+
+        x = np.full(nb_paths, process.S0, dtype=float)
+        reducer.update(x)
+        for x in steps:
+            reducer.update(x)
+        return reducer.finalize(x)
+
+    def _one_factor_steps(self, process: OneFactorStochasticProcess, nb_paths: int, seed: int, antithetic: bool = False):
+        """
+        Yields the simulated prices of a one factor process step by step.
+        """
+        x = np.full(nb_paths, process.S0, dtype=float)
         dt = process.dt
-        dW = process.get_random_increments(nb_paths, seed)
+        dW = process.get_random_increments(nb_paths, seed, antithetic)
 
         for i in range(process.nb_steps):
-            t = i * dt
-            x = paths[:, i]
             dW_i = dW[:, i]
             drift = process.get_drift(i, x)
             vol = process.get_volatility(i, x)
 
-            paths[:, i + 1] = x + drift * dt + vol  * dW_i
-        return paths
+            x = x + drift * dt + vol  * dW_i
+            yield x
 
-    def _simulate_two_factor(self, process: TwoFactorStochasticProcess, nb_paths: int, seed: int) -> np.ndarray:
-        paths = np.zeros((nb_paths, process.nb_steps + 1, 2))
-        paths[:, 0, 0] = process.S0
-        paths[:, 0, 1] = process.v0
+    def _two_factor_steps(self, process: TwoFactorStochasticProcess, nb_paths: int, seed: int, antithetic: bool = False):
+        """
+        Yields the simulated prices of a two factor process step by step.
+        """
+        x = np.full(nb_paths, process.S0, dtype=float)
+        v = np.full(nb_paths, process.v0, dtype=float)
         dt = process.dt
         sqrt_dt = np.sqrt(dt)
-        dW1, dW2 = process.get_random_increments(nb_paths, seed)
+        dW1, dW2 = process.get_random_increments(nb_paths, seed, antithetic)
         for i in range(process.nb_steps):
-            t = i * dt
-            x = paths[:, i, 0]
-            v = paths[:, i, 1]
             dW1_i = dW1[:, i]
             dW2_i = dW2[:, i]
 
@@ -50,7 +77,22 @@ class EulerScheme:
             x_next = x + drift * dt + np.sqrt(np.maximum(v, 0)) * x * sqrt_dt * dW1_i
             v_next = v + vol_drift * dt + vol_vol * sqrt_dt * dW2_i
 
-            paths[:, i + 1, 0] = x_next
-            paths[:, i + 1, 1] = v_next
+            x, v = x_next, v_next
+            yield x
 
-        return paths[:, :, 0] 
+    def _simulate_one_factor(self, process: OneFactorStochasticProcess, nb_paths: int, seed: int, antithetic: bool = False) -> np.ndarray:
+        paths = np.zeros((nb_paths, process.nb_steps + 1))
+        paths[:, 0] = process.S0
+
+        for i, x in enumerate(self._one_factor_steps(process, nb_paths, seed, antithetic)):
+            paths[:, i + 1] = x
+        return paths
+
+    def _simulate_two_factor(self, process: TwoFactorStochasticProcess, nb_paths: int, seed: int, antithetic: bool = False) -> np.ndarray:
+        paths = np.zeros((nb_paths, process.nb_steps + 1))
+        paths[:, 0] = process.S0
+
+        for i, x in enumerate(self._two_factor_steps(process, nb_paths, seed, antithetic)):
+            paths[:, i + 1] = x
+
+        return paths
@@ -0,0 +1,64 @@
+import numpy as np
+
+class PathReducer:
+    """
+    Reduces the simulated paths step by step into Structure-of-Arrays buffers.
+
+    Most payoffs only need a few statistics of each path (final price, running maximum or minimum),
+    so the scheme can feed every simulated step to this reducer instead of storing the full paths.
+    The requested reductions are given by the REQUIRES tag of the product:
+        - "final" / "final_per_asset": prices at the last step
+        - "running_max": maximum reached by each path
+        - "running_min": minimum reached by each path
+    """
+    REDUCTIONS = ("final", "final_per_asset", "running_max", "running_min")
+
+    def __init__(self, requires: tuple):
+        """
+        Parameters:
+            requires (tuple): the reductions needed by the product
+        """
+        unknown = set(requires) - set(self.REDUCTIONS)
+        if unknown:
+            raise ValueError(f"Unsupported path reductions: {sorted(unknown)}.")
+        self.requires = tuple(requires)
+        self.buffers = {}
+        self._extrema = [(name, np.maximum if name == "running_max" else np.minimum)
+                         for name in self.requires if name in ("running_max", "running_min")]
+
+    def update(self, step_prices: np.ndarray) -> None:
+        """
+        Updates in place the running reductions with the prices of the current step.
+        The buffers are allocated once, at the first step.
+
+        Parameters:
+            step_prices (np.ndarray): prices of all the paths at the current step
+        """
+        for name, reduce in self._extrema:
+            buffer = self.buffers.get(name)
+            if buffer is None:
+                self.buffers[name] = np.array(step_prices, dtype=float)
+            else:
+                reduce(buffer, step_prices, out=buffer)
+
+    def finalize(self, final_prices: np.ndarray) -> dict:
+        """
+        Stores the prices of the last step and returns the reduced buffers.
+
+        Parameters:
+            final_prices (np.ndarray): prices of all the paths at the last step
+
+        Returns:
+            dict: the reduced buffers, indexed by reduction name
+
+        Raises:
+            ValueError: If the per asset prices are requested from a simulation that is not (n_paths, n_assets)
+        """
+        if "final" in self.requires:
+            self.buffers["final"] = final_prices
+        if "final_per_asset" in self.requires:
+            if np.ndim(final_prices) != 2:
+                raise ValueError("The 'final_per_asset' reduction needs final prices of shape (n_paths, n_assets), "
+                                 f"got shape {np.shape(final_prices)} from a single asset simulation.")
+            self.buffers["final_per_asset"] = final_prices
+        return self.buffers
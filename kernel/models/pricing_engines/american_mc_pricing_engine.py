@@ -47,7 +47,7 @@ class AmericanMCPricingEngine(MCPricingEngine):
     def _get_price(self, derivative : AmericanAbstractOption , stochastic_process : StochasticProcess) -> float:
         
         scheme = EulerScheme()
-        paths=scheme.simulate_paths(process=stochastic_process, nb_paths=self.nb_paths, seed=self.random_seed)
+        paths=scheme.simulate_paths(process=stochastic_process, nb_paths=self.nb_paths, seed=self.random_seed, antithetic=self.antithetic)
 
 
         dt = derivative.maturity / self.nb_steps
@@ -57,8 +57,10 @@ class AmericanMCPricingEngine(MCPricingEngine):
             exercise_indices = set(int(t_ex / dt) for t_ex in derivative.exercise_times)
 
         CF = derivative.instrinsec_payoff(paths[:, -1])
+        # Discount factors of the whole time grid, evaluated once: DF(dt * (k + 1)) for k = 0 .. nb_steps - 1
+        discount_factors = self.market.get_discount_factors(dt * np.arange(1, self.nb_steps + 1))
         for t in range(self.nb_steps - 2, -1, -1):
-            df_forward = self.market.get_fwd_discount_factor(dt * (t + 1),dt * (t + 2))
+            df_forward = discount_factors[t + 1] / discount_factors[t]
             discounted_CF = CF * df_forward
             CF = discounted_CF.copy()
             
@@ -50,16 +50,16 @@ class CallableMCPricingEngine(MCPricingEngine):
     def _get_price(self, derivative: AbstractAutocall, process : StochasticProcess) -> float:
 
         scheme = EulerScheme()
-        paths = scheme.simulate_paths(process, self.nb_paths, self.random_seed)
-        total_payoff = []
-        for path in paths:
+        paths = scheme.simulate_paths(process, self.nb_paths, self.random_seed, self.antithetic)
+        payoffs = np.empty(len(paths))
+        call_indices = np.empty(len(paths))
+        for i, path in enumerate(paths):
             # For each path we compute the cashflow sum according to the callable parameters and the index of the call date
-            payoff, t_call = derivative.payoff(path)
-            # Mapping from the index of the call date to the number of year
-            discount_time = t_call / self.obs_frequency.value
-            # We discount the sum of cashflow frow the call date to the present date
-            total_payoff.append(payoff * self.market.get_discount_factor(discount_time))
-        return np.mean(total_payoff)
+            payoffs[i], call_indices[i] = derivative.payoff(path)
+        # Mapping from the index of the call date to the number of year
+        discount_times = call_indices / self.obs_frequency.value
+        # We discount the sum of cashflow frow the call date to the present date, for all the paths at once
+        return np.mean(payoffs * self.market.get_discount_factors(discount_times))
 
     def get_coupon(self, derivative: 'CallableProduct',process : StochasticProcess, epsilon: float = 1e-2, max_iter: int = 25, target_price: float = 100) -> float: # type: ignore
         """
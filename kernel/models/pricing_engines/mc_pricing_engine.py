@@ -9,6 +9,8 @@ from utils.pricing_results import PricingResults
 from kernel.models.stochastic_processes import BlackScholesProcess,HestonProcess
 from kernel.models.stochastic_processes.black_scholes_process import BlackScholesProcess
 from kernel.models.discritization_schemes.euler_scheme import EulerScheme
+from kernel.models.discritization_schemes.path_reducer import PathReducer
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 
@@ -33,19 +35,19 @@ class MCPricingEngine(AbstractPricingEngine):
         self.nb_paths = settings.nb_paths
         self.nb_steps = settings.nb_steps
         self.random_seed = settings.random_seed
+        self.antithetic = settings.antithetic
         self.enable_greeks = settings.compute_greeks 
         self.valuation_date = settings.valuation_date # pas sur que ca serve 
         self.model = settings.model
+        self.payoff_workers = settings.payoff_workers
 
     def get_results(self, derivative: AbstractOption) -> PricingResults:
         self.derivative = derivative
         if(isinstance(derivative, AbstractOptionStrategy)):
-            #if its an abstract option strategy, its a list of abstract options
+            #if its an abstract option strategy, its a list of abstract options with signed quantities
             strat_results = []
-            for opt,is_long in derivative.options:
-                position = 1 if is_long else -1
-                process = self.get_stochastic_process(derivative=opt,market=self.market)
-                result = self.get_result(derivative=opt,position=position)
+            for opt,quantity in derivative.options:
+                result = self.get_result(derivative=opt,position=quantity)
                 strat_results.append(result)
             return PricingResults.get_aggregated_results(strat_results)
         else:
@@ -53,12 +55,13 @@ class MCPricingEngine(AbstractPricingEngine):
             return self.get_result(derivative)
 
 
-    def get_result(self, derivative: AbstractOption,position : int = 1) -> PricingResults:
+    def get_result(self, derivative: AbstractOption,position : float = 1) -> PricingResults:
         """
         Returns the results of the pricing engine.
 
         Parameters:
             derivative (AbstractOption): The derivative to price.
+            position (float): Signed quantity of the derivative held (negative when sold).
 
         Returns:
             dict: A dictionary containing the results of the pricing engine.
@@ -71,16 +74,17 @@ class MCPricingEngine(AbstractPricingEngine):
         pricing_results = PricingResults()
         pricing_results.price = price * position
 
-        delta= self.get_delta(derivative=derivative, epsilon=1) * position
-        gamma = self.get_gamma(derivative=derivative, epsilon=1) * position
-        vega = self.get_vega(derivative=derivative, epsilon=0.01) * position
-        rho = self.get_rho(derivative=derivative, epsilon=0.0001) * position
-        theta = self.get_theta(price=price, delta=delta, gamma=gamma, vega=vega, derivative=derivative, market=self.market) * position
-        pricing_results.set_greek("delta", delta)
-        pricing_results.set_greek("gamma", gamma)
-        pricing_results.set_greek("vega", vega)
-        pricing_results.set_greek("rho", rho)
-        pricing_results.set_greek("theta", theta)
+        delta= self.get_delta(derivative=derivative, epsilon=1)
+        gamma = self.get_gamma(derivative=derivative, epsilon=1)
+        vega = self.get_vega(derivative=derivative, epsilon=0.01)
+        rho = self.get_rho(derivative=derivative, epsilon=0.0001)
+        # Theta is computed on the unit position, then every greek is scaled by the position once
+        theta = self.get_theta(price=price, delta=delta, gamma=gamma, vega=vega, derivative=derivative, market=self.market)
+        pricing_results.set_greek("delta", delta * position)
+        pricing_results.set_greek("gamma", gamma * position)
+        pricing_results.set_greek("vega", vega * position)
+        pricing_results.set_greek("rho", rho * position)
+        pricing_results.set_greek("theta", theta * position)
         
         return pricing_results
     
@@ -113,12 +117,44 @@ class MCPricingEngine(AbstractPricingEngine):
     def _get_price(self, derivative: AbstractOption,stochastic_process: StochasticProcess) -> float:
         #le paramètre process servira probablement pour les grecs
         scheme = EulerScheme()
-        price_paths=scheme.simulate_paths(process=stochastic_process, nb_paths=self.nb_paths, seed=self.random_seed)
-        payoffs = np.array([derivative.payoff(path) for path in price_paths])
+        if "path" not in derivative.REQUIRES:
+            # The payoff only needs some reductions of the paths (final prices, running extremum ...),
+            # which are computed during the simulation instead of storing the full paths
+            reducer = PathReducer(derivative.REQUIRES)
+            reductions = scheme.simulate_reduced_paths(process=stochastic_process, nb_paths=self.nb_paths,
+                                                       reducer=reducer, seed=self.random_seed, antithetic=self.antithetic)
+            payoffs = derivative.payoff_from_reductions(reductions)
+        else:
+            price_paths=scheme.simulate_paths(process=stochastic_process, nb_paths=self.nb_paths, seed=self.random_seed,
+                                              antithetic=self.antithetic)
+            payoffs = self._evaluate_payoffs(derivative, price_paths)
         price = np.mean(payoffs) * self.market.get_discount_factor(derivative.maturity)
         return price
 
 
+    def _evaluate_payoffs(self, derivative: AbstractOption, price_paths: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the payoff of every simulated path.
+
+        The paths are independent, so when several payoff workers are configured the path axis is split
+        into contiguous chunks evaluated in a thread pool (NumPy releases the GIL in the vectorized payoffs).
+
+        Parameters:
+            derivative (AbstractOption): The derivative to price.
+            price_paths (np.ndarray): The simulated paths, one path per row.
+
+        Returns:
+            np.ndarray: The payoff of each path.
+        """
+        nb_workers = min(self.payoff_workers or 1, len(price_paths))
+        if nb_workers <= 1:
+            # One payoff call over all the simulated paths at once
+            return derivative.payoff_batch(price_paths)
+
+        chunks = np.array_split(price_paths, nb_workers)
+        with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+            return np.concatenate(list(executor.map(derivative.payoff_batch, chunks)))
+
     def get_delta(self, derivative: AbstractOption, epsilon: float = 1) -> float:
         """
         Calcule le delta du produit via différence finie centrée, sans modifier de variables d'instance.
@@ -28,17 +28,19 @@ class BlackScholesProcess(OneFactorStochasticProcess):
     def get_volatility(self, t:int, x:np.ndarray) -> np.ndarray:
         return self.sigma * x
     
-    def get_random_increments(self, nb_paths : int, seed :int = 4012) -> np.ndarray:
+    def get_random_increments(self, nb_paths : int, seed :int = 4012, antithetic: bool = False) -> np.ndarray:
         """
         Generates random increments of the brownian motion of Black-Scholes process.
 
         Parameters:
             nb_paths (int): The number of paths to simulate
             seed (int): The seed for the random number generator. Default is 4012
+            antithetic (bool): Whether the paths are drawn by antithetic pairs. Default is False
         
         Returns:
             np.ndarray: The generated increments for the brownian motion
         """
         rng = np.random.default_rng(seed)
-        Z = rng.standard_normal(size=(nb_paths, self.nb_steps))
-        return Z * np.sqrt(self.dt)
\ No newline at end of file
+        Z = self.draw_standard_normals(rng, nb_paths, antithetic)
+        Z *= np.sqrt(self.dt)  # Scaled in place, without a second (nb_paths, nb_steps) array
+        return Z
\ No newline at end of file
@@ -42,13 +42,14 @@ class HestonProcess(TwoFactorStochasticProcess):
     def get_vol_vol(self, t: int, v: np.ndarray) -> np.ndarray:
         """Volatility of the volatility (variance process)."""
         return self.sigma * np.sqrt(np.maximum(v, 0))  # Ensure positivity
-    def get_random_increments(self, nb_paths: int, seed: int = 4012) -> Tuple[np.ndarray, np.ndarray]:
+    def get_random_increments(self, nb_paths: int, seed: int = 4012, antithetic: bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generates the two correlated brownian motions of the Heston process with the Cholesky decomposition.
 
         Parameters:
             nb_paths (int): The number of paths to simulate
             seed (int): The seed for the random number generator. Default is 4012
+            antithetic (bool): Whether the paths are drawn by antithetic pairs (the correlated motion then is too). Default is False
         
         Returns:
             Tuple[np.ndarray, np.ndarray]: The generated increments for the two correlated brownian motions
@@ -58,11 +59,16 @@ class HestonProcess(TwoFactorStochasticProcess):
         rng2 = np.random.default_rng(seed + 1)
 
         # Generate the two independent brownian motions
-        Z1 = rng.standard_normal(size=(nb_paths, self.nb_steps))
-        Z2 = rng2.standard_normal(size=(nb_paths, self.nb_steps))   
+        Z1 = self.draw_standard_normals(rng, nb_paths, antithetic)
+        Z2 = self.draw_standard_normals(rng2, nb_paths, antithetic)   
 
-        # Apply the Cholesky decomposition to get the correlated brownian motions 
-        Z3 = self.rho * Z1 + np.sqrt(1 - self.rho**2) * Z2
+        # Apply the Cholesky decomposition to get the correlated brownian motions, in place in the buffer of Z2
+        Z3 = Z2
+        Z3 *= np.sqrt(1 - self.rho**2)
+        Z3 += self.rho * Z1
 
-        return Z1 * np.sqrt(self.dt), Z3 * np.sqrt(self.dt)
+        sqrt_dt = np.sqrt(self.dt)
+        Z1 *= sqrt_dt
+        Z3 *= sqrt_dt
+        return Z1, Z3
         
\ No newline at end of file
@@ -28,14 +28,38 @@ class StochasticProcess(ABC):
         self.dt = dt
         self.nb_factors = nb_factors
 
+    def draw_standard_normals(self, rng: np.random.Generator, nb_paths: int, antithetic: bool = False) -> np.ndarray:
+        """
+        Draws the standard normal variables of one brownian motion for every path and step.
+        With antithetic variates, only the first half of the paths is drawn and the second half is its opposite,
+        which reduces the variance of monotonic payoffs at no extra random number cost.
+
+        Parameters:
+            rng (np.random.Generator): The random number generator
+            nb_paths (int): The number of paths to simulate
+            antithetic (bool): Whether the paths are drawn by antithetic pairs. Default is False
+
+        Returns:
+            np.ndarray: The standard normal variables of shape (nb_paths, nb_steps)
+        """
+        if not antithetic:
+            return rng.standard_normal(size=(nb_paths, self.nb_steps))
+
+        half = (nb_paths + 1) // 2
+        Z = np.empty((nb_paths, self.nb_steps))
+        rng.standard_normal(out=Z[:half])
+        np.negative(Z[:nb_paths - half], out=Z[half:])
+        return Z
+
     @abstractmethod
-    def get_random_increments(self, nb_paths: int, seed: int = 4012) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    def get_random_increments(self, nb_paths: int, seed: int = 4012, antithetic: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """
         Generates random increments of the brownian motion(s).
 
         Parameters:
             nb_paths (int): The number of paths to simulate
             seed (int): The seed for the random number generator. Default is 4012
+            antithetic (bool): Whether the paths are drawn by antithetic pairs. Default is False
         
         Returns:
             np.ndarray: The generated increments for the brownian motion
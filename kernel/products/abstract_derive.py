@@ -5,6 +5,9 @@ class AbstractDerive(ABC):
     """
     Classe abstraite représentant les différents dérivés.
     """
+    # Réductions des chemins simulés nécessaires au payoff ("path" : chemins complets)
+    REQUIRES = ("path",)
+
     @abstractmethod
     def payoff(self, path: np.ndarray) -> float:
         """
@@ -16,4 +19,28 @@ class AbstractDerive(ABC):
         Returns:
             float:  Le payoff du dérivé.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff du dérivé pour l'ensemble des chemins simulés.
+        Implémentation par défaut appliquant le payoff chemin par chemin : les produits
+        dont le payoff s'y prête la redéfinissent de façon vectorisée.
+
+        Args:
+            paths (np.ndarray): Chemins simulés des prix ou des valeurs sous-jacentes.
+        Returns:
+            np.ndarray: Le payoff du dérivé pour chaque chemin.
+        """
+        return np.fromiter((self.payoff(path) for path in paths), dtype=np.float64, count=len(paths))
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff du dérivé à partir des réductions des chemins simulés listées dans REQUIRES.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés (prix finaux, extremum courant...), indexées par nom.
+        Returns:
+            np.ndarray: Le payoff du dérivé pour chaque chemin.
+        """
+        return self.payoff_batch(reductions["path"])
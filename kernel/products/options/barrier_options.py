@@ -1,21 +1,55 @@
 import numpy as np
+from abc import abstractmethod
 from .abstract_option import AbstractOption
 
 class AbstractBarrierOption(AbstractOption):
     """
     Classe abstraite représentant les différentes options à barrière.
     """
+    _EXTREMUM = "running_max"  # Extremum courant observé pour la barrière ("running_max" ou "running_min")
+    REQUIRES = ("final", _EXTREMUM)
+
     def __init__(self, maturity : float, strike : float, barrier : float):
         """
         Initialise une option à barrière avec une maturity, un prix d'exercice et une barrière.
         """
         super().__init__(maturity, strike)
         self.barrier = barrier
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule les payoffs de l'option pour l'ensemble des chemins simulés (n_paths, n_steps).
+        """
+        running_extremum = paths.max(axis=1) if self._EXTREMUM == "running_max" else paths.min(axis=1)
+        return self.payoff_from_extremum(paths[:, -1], running_extremum)
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule les payoffs de l'option à partir des prix finaux et de l'extremum courant de chaque chemin.
+        """
+        return self.payoff_from_extremum(reductions["final"], reductions[self._EXTREMUM])
+
+    @abstractmethod
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        """
+        Calcule les payoffs à partir des seuls prix finaux et de l'extremum atteint par chaque chemin.
+
+        Args:
+            final_prices (np.ndarray): Prix finaux du sous-jacent pour chaque chemin.
+            running_extremum (np.ndarray): Maximum (barrière haute) ou minimum (barrière basse) de chaque chemin.
+
+        Returns:
+            np.ndarray: Payoffs de l'option pour chaque chemin.
+        """
+        pass
     
 class UpBarrierOption(AbstractBarrierOption):
     """
     Classe abstraite pour les options avec barrière haute.
     """
+    _EXTREMUM = "running_max"
+    REQUIRES = ("final", _EXTREMUM)
+
     def __init__(self, maturity : float, strike : float, barrier : float):
         super().__init__(maturity, strike, barrier)
         if self.barrier <= self.strike:
@@ -25,10 +59,17 @@ class UpBarrierOption(AbstractBarrierOption):
         """Vérifie si la barrière haute est franchie."""
         return np.max(path) > self.barrier
 
+    def is_barrier_breached_batch(self, running_max: np.ndarray) -> np.ndarray:
+        """Vérifie pour chaque chemin, à partir de son maximum, si la barrière haute est franchie."""
+        return running_max > self.barrier
+
 class DownBarrierOption(AbstractBarrierOption):
     """
     Classe abstraite pour les options avec barrière basse.
     """
+    _EXTREMUM = "running_min"
+    REQUIRES = ("final", _EXTREMUM)
+
     def __init__(self, maturity : float, strike : float, barrier : float):
         super().__init__(maturity, strike, barrier)
         if self.barrier >= self.strike:
@@ -38,6 +79,10 @@ class DownBarrierOption(AbstractBarrierOption):
         """Vérifie si la barrière basse est franchie."""
         return np.min(path) < self.barrier
 
+    def is_barrier_breached_batch(self, running_min: np.ndarray) -> np.ndarray:
+        """Vérifie pour chaque chemin, à partir de son minimum, si la barrière basse est franchie."""
+        return running_min < self.barrier
+
 class UpAndOutCallOption(UpBarrierOption):
     """
     Classe représentant une option à barrière d'achat (call) avec barrière haute UpAndOut.
@@ -47,6 +92,10 @@ class UpAndOutCallOption(UpBarrierOption):
             return 0
         return max(0, path[-1] - self.strike)
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(final_prices - self.strike, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), 0.0, intrinsic)
+
 class UpAndInCallOption(UpBarrierOption):
     """
     Classe représentant une option à barrière d'achat (call) avec barrière haute Up And In.
@@ -56,6 +105,10 @@ class UpAndInCallOption(UpBarrierOption):
             return max(0, path[-1] - self.strike)
         return 0
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(final_prices - self.strike, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), intrinsic, 0.0)
+
 class DownAndInCallOption(DownBarrierOption):
     """
     Classe représentant une option à barrière d'achat (call) avec barrière basse Down And In.
@@ -65,6 +118,10 @@ class DownAndInCallOption(DownBarrierOption):
             return max(0, path[-1] - self.strike)
         return 0
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(final_prices - self.strike, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), intrinsic, 0.0)
+
 class DownAndOutCallOption(DownBarrierOption):
     """
     Classe représentant une option à barrière d'achat (call) avec barrière basse Down And Out.
@@ -74,6 +131,10 @@ class DownAndOutCallOption(DownBarrierOption):
             return 0
         return max(0, path[-1] - self.strike)
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(final_prices - self.strike, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), 0.0, intrinsic)
+
 class UpAndInPutOption(UpBarrierOption):
     """
     Classe représentant une option à barrière de vente (put) avec barrière haute Up And In.
@@ -83,6 +144,10 @@ class UpAndInPutOption(UpBarrierOption):
             return max(0, self.strike - path[-1])
         return 0
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(self.strike - final_prices, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), intrinsic, 0.0)
+
 class UpAndOutPutOption(UpBarrierOption):
     """
     Classe représentant une option à barrière de vente (put) avec barrière haute Up And Out.
@@ -92,6 +157,10 @@ class UpAndOutPutOption(UpBarrierOption):
             return 0
         return max(0, self.strike - path[-1])
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(self.strike - final_prices, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), 0.0, intrinsic)
+
 class DownAndInPutOption(DownBarrierOption):
     """
     Classe représentant une option à barrière de vente (put) avec barrière basse Down And In.
@@ -101,6 +170,10 @@ class DownAndInPutOption(DownBarrierOption):
             return max(0, self.strike - path[-1])
         return 0
 
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(self.strike - final_prices, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), intrinsic, 0.0)
+
 class DownAndOutPutOption(DownBarrierOption):
     """
     Classe représentant une option à barrière de vente (put) avec barrière basse Down And Out.
@@ -108,4 +181,8 @@ class DownAndOutPutOption(DownBarrierOption):
     def payoff(self, path: np.ndarray) -> float:
         if self.is_barrier_breached(path):
             return 0
-        return max(0, self.strike - path[-1])
\ No newline at end of file
+        return max(0, self.strike - path[-1])
+
+    def payoff_from_extremum(self, final_prices: np.ndarray, running_extremum: np.ndarray) -> np.ndarray:
+        intrinsic = np.maximum(self.strike - final_prices, 0.0)
+        return np.where(self.is_barrier_breached_batch(running_extremum), 0.0, intrinsic)
\ No newline at end of file
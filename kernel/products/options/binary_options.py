@@ -5,12 +5,25 @@ class AbstractBinaryOption(AbstractOption):
     """
     Classe abstraite représentant les différentes options binaires.
     """
+    REQUIRES = ("final",)
+
     def __init__(self, maturity : float, strike : float, coupon : float):
         """
         Initialise une option binaire avec une maturity, un prix d'exercice et un coupon.   "
         """
         super().__init__(maturity, strike)
         self.coupon = coupon
+
+    def payoff_batch(self, paths : np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option binaire pour l'ensemble des chemins simulés.
+        
+        Args:
+            paths (np.ndarray): Chemins simulés des prix du sous-jacent de forme (n_paths, n_steps + 1).
+        Returns:
+            np.ndarray:  Le payoff de l'option binaire pour chaque chemin.
+        """
+        return self.payoff_from_reductions({"final": paths[:, -1]})
    
 
 class BinaryCallOption(AbstractBinaryOption):
@@ -32,6 +45,17 @@ class BinaryCallOption(AbstractBinaryOption):
             return self.coupon
         else:
             return 0
+
+    def payoff_from_reductions(self, reductions : dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option binaire d'achat (call) à partir des prix finaux de chaque chemin.
+        
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux ("final").
+        Returns:
+            np.ndarray:  Le payoff de l'option binaire d'achat (call) pour chaque chemin.
+        """
+        return np.where(reductions["final"] > self.strike, float(self.coupon), 0.0)
         
 class BinaryPutOption(AbstractBinaryOption):
     """
@@ -52,4 +76,15 @@ class BinaryPutOption(AbstractBinaryOption):
             return self.coupon
         else:
             return 0
+
+    def payoff_from_reductions(self, reductions : dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option binaire de vente (put) à partir des prix finaux de chaque chemin.
+        
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux ("final").
+        Returns:
+            np.ndarray:  Le payoff de l'option binaire de vente (put) pour chaque chemin.
+        """
+        return np.where(reductions["final"] < self.strike, float(self.coupon), 0.0)
     
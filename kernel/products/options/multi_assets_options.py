@@ -1,11 +1,30 @@
 from .abstract_option import AbstractOption
+from functools import lru_cache
 import numpy as np
 
+@lru_cache(maxsize=None)
+def _equal_weights(n_assets: int) -> np.ndarray:
+    """
+    Retourne (et met en cache) le vecteur de poids égaux pour un nombre de sous-jacents donné.
+    """
+    weights = np.full(n_assets, 1.0 / n_assets)
+    weights.setflags(write=False)
+    return weights
+
+@lru_cache(maxsize=None)
+def _weighted_average_path(n_assets: int) -> list:
+    """
+    Retourne (et met en cache) le chemin de contraction optimal de la moyenne pondérée pour un nombre de sous-jacents donné.
+    """
+    return np.einsum_path('a,pa->p', np.empty(n_assets), np.empty((1, n_assets)), optimize='optimal')[0]
+
 class AbstractMultiAssetOption(AbstractOption):
     """
     Classe abstraite pour les options avec plusieurs sous-jacents.
     """
-    def __init__(self, maturity : float, strike : float, weights:np.ndarray=None):
+    REQUIRES = ("final_per_asset",)
+
+    def __init__(self, maturity : float, strike : float, weights:np.ndarray=None, n_assets: int=None):
         """
         Initialise une option multi-sous-jacent.
 
@@ -13,9 +32,28 @@ class AbstractMultiAssetOption(AbstractOption):
             maturity (float): Maturité de l'option.
             strike (float): Prix d'exercice de l'option.
             weights (np.ndarray, optional): Poids des sous-jacents. Par défaut, poids égaux.
+            n_assets (int, optional): Nombre de sous-jacents, permet de fixer les poids égaux dès l'initialisation.
         """
         super().__init__(maturity, strike)
-        self.weights = weights
+        if weights is None and n_assets is not None:
+            weights = _equal_weights(n_assets)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64) if weights is not None else None
+        if self.weights is not None:
+            _weighted_average_path(self.weights.shape[0])  # Chemin de contraction précalculé dès l'initialisation
+
+    def get_weights(self, n_assets: int) -> np.ndarray:
+        """
+        Retourne les poids des sous-jacents, sans modifier l'état de l'option.
+
+        Args:
+            n_assets (int): Nombre de sous-jacents des chemins fournis.
+
+        Returns:
+            np.ndarray: Poids des sous-jacents (poids égaux si aucun poids n'a été fourni).
+        """
+        if self.weights is None:
+            return _equal_weights(n_assets)  # Poids égaux par défaut
+        return self.weights
 
     def weighted_average(self, paths: np.ndarray) -> float:
         """
@@ -27,9 +65,58 @@ class AbstractMultiAssetOption(AbstractOption):
         Returns:
             float: Moyenne pondérée des sous-jacents.
         """
-        if self.weights is None:
-            self.weights = np.ones(paths.shape[0]) / paths.shape[0]  # Poids égaux par défaut
-        return np.dot(self.weights, paths)
+        return np.dot(self.get_weights(paths.shape[0]), paths)
+
+    def weighted_average_batch(self, final_prices: np.ndarray) -> np.ndarray:
+        """
+        Calcule la moyenne pondérée des sous-jacents pour l'ensemble des chemins simulés.
+
+        Args:
+            final_prices (np.ndarray): Prix finaux des sous-jacents de forme (n_paths, n_assets).
+
+        Returns:
+            np.ndarray: Moyenne pondérée des sous-jacents pour chaque chemin.
+        """
+        weights = self.get_weights(final_prices.shape[1])
+        return np.einsum('a,pa->p', weights, final_prices, optimize=_weighted_average_path(weights.shape[0]))
+
+    @staticmethod
+    def best_performance_batch(final_prices: np.ndarray) -> np.ndarray:
+        """
+        Calcule le meilleur prix final parmi les sous-jacents pour chaque chemin.
+
+        Args:
+            final_prices (np.ndarray): Prix finaux des sous-jacents de forme (n_paths, n_assets).
+
+        Returns:
+            np.ndarray: Meilleur prix final de chaque chemin, dans un tableau float64 nouvellement alloué.
+        """
+        return np.max(final_prices, axis=1, out=np.empty(final_prices.shape[0], dtype=np.float64))
+
+    @staticmethod
+    def worst_performance_batch(final_prices: np.ndarray) -> np.ndarray:
+        """
+        Calcule le pire prix final parmi les sous-jacents pour chaque chemin.
+
+        Args:
+            final_prices (np.ndarray): Prix finaux des sous-jacents de forme (n_paths, n_assets).
+
+        Returns:
+            np.ndarray: Pire prix final de chaque chemin, dans un tableau float64 nouvellement alloué.
+        """
+        return np.min(final_prices, axis=1, out=np.empty(final_prices.shape[0], dtype=np.float64))
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix des sous-jacents de forme (n_paths, n_assets, n_steps).
+
+        Returns:
+            np.ndarray: Les payoffs de l'option pour chaque chemin.
+        """
+        return self.payoff_from_reductions({"final_per_asset": paths[..., -1]})
     
 class BasketCallOption(AbstractMultiAssetOption):
     """
@@ -47,6 +134,21 @@ class BasketCallOption(AbstractMultiAssetOption):
         """
         basket_price = self.weighted_average(paths[:, -1])  # Moyenne pondérée des prix finaux
         return max(0, basket_price - self.strike)  # Payoff pour un call
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option basket à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option basket pour chaque chemin.
+        """
+        basket_prices = self.weighted_average_batch(reductions["final_per_asset"])
+        # Le panier est un tableau temporaire : le payoff est calculé en place, sans nouvelle allocation
+        np.subtract(basket_prices, self.strike, out=basket_prices)
+        return np.maximum(basket_prices, 0.0, out=basket_prices)
     
 class BasketPutOption(AbstractMultiAssetOption):
     """
@@ -65,6 +167,20 @@ class BasketPutOption(AbstractMultiAssetOption):
         basket_price = self.weighted_average(paths[:, -1])  # Moyenne pondérée des prix finaux
         return max(0, self.strike - basket_price)  # Payoff pour un call
 
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option basket à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option basket pour chaque chemin.
+        """
+        basket_prices = self.weighted_average_batch(reductions["final_per_asset"])
+        np.subtract(self.strike, basket_prices, out=basket_prices)
+        return np.maximum(basket_prices, 0.0, out=basket_prices)
+
 class BestOfCallOption(AbstractMultiAssetOption):
     """
     Classe représentant une option Best-Of Call.
@@ -83,6 +199,20 @@ class BestOfCallOption(AbstractMultiAssetOption):
         best_performance = np.max(paths[:, -1])  # Meilleur prix final parmi les sous-jacents
         return max(0, best_performance - self.strike)  # Payoff pour un call
 
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option Best-Of Call à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option Best-Of Call pour chaque chemin.
+        """
+        best_performances = self.best_performance_batch(reductions["final_per_asset"])
+        np.subtract(best_performances, self.strike, out=best_performances)
+        return np.maximum(best_performances, 0.0, out=best_performances)
+
 
 class BestOfPutOption(AbstractMultiAssetOption):
     """
@@ -102,6 +232,20 @@ class BestOfPutOption(AbstractMultiAssetOption):
         best_performance = np.max(paths[:, -1])  # Meilleur prix final parmi les sous-jacents
         return max(0, self.strike - best_performance)  # Payoff pour un put
 
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option Best-Of Put à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option Best-Of Put pour chaque chemin.
+        """
+        best_performances = self.best_performance_batch(reductions["final_per_asset"])
+        np.subtract(self.strike, best_performances, out=best_performances)
+        return np.maximum(best_performances, 0.0, out=best_performances)
+
 
 class WorstOfCallOption(AbstractMultiAssetOption):
     """
@@ -121,6 +265,20 @@ class WorstOfCallOption(AbstractMultiAssetOption):
         worst_performance = np.min(paths[:, -1])  # Pire prix final parmi les sous-jacents
         return max(0, worst_performance - self.strike)  # Payoff pour un call
 
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option Worst-Of Call à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option Worst-Of Call pour chaque chemin.
+        """
+        worst_performances = self.worst_performance_batch(reductions["final_per_asset"])
+        np.subtract(worst_performances, self.strike, out=worst_performances)
+        return np.maximum(worst_performances, 0.0, out=worst_performances)
+
 
 class WorstOfPutOption(AbstractMultiAssetOption):
     """
@@ -138,4 +296,18 @@ class WorstOfPutOption(AbstractMultiAssetOption):
             float: Le payoff de l'option Worst-Of Put.
         """
         worst_performance = np.min(paths[:, -1])  # Pire prix final parmi les sous-jacents
-        return max(0, self.strike - worst_performance)  # Payoff pour un put
\ No newline at end of file
+        return max(0, self.strike - worst_performance)  # Payoff pour un put
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff de l'option Worst-Of Put à partir des prix finaux des sous-jacents de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux par sous-jacent ("final_per_asset").
+
+        Returns:
+            np.ndarray: Les payoffs de l'option Worst-Of Put pour chaque chemin.
+        """
+        worst_performances = self.worst_performance_batch(reductions["final_per_asset"])
+        np.subtract(self.strike, worst_performances, out=worst_performances)
+        return np.maximum(worst_performances, 0.0, out=worst_performances)
\ No newline at end of file
@@ -18,6 +18,18 @@ class AsianCallOption(AbstractOption):
         average_price = np.mean(path)  # Moyenne des prix
         return max(0, average_price - self.strike)  
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option asiatique call pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff de l'option asiatique call pour chaque chemin.
+        """
+        return np.maximum(paths.mean(axis=1) - self.strike, 0.0)
+
 
 class AsianPutOption(AbstractOption):
     """
@@ -36,6 +48,18 @@ class AsianPutOption(AbstractOption):
         average_price = np.mean(path)  # Moyenne des prix
         return max(0, self.strike - average_price)  
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option asiatique put pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff de l'option asiatique put pour chaque chemin.
+        """
+        return np.maximum(self.strike - paths.mean(axis=1), 0.0)
+
 
 class LookbackCallOption(AbstractOption):
     """
@@ -54,6 +78,18 @@ class LookbackCallOption(AbstractOption):
         max_price = np.max(path)  # Prix maximum atteint
         return max(0, max_price - self.strike)  
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option lookback call pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff de l'option lookback call pour chaque chemin.
+        """
+        return np.maximum(paths.max(axis=1) - self.strike, 0.0)
+
 
 class LookbackPutOption(AbstractOption):
     """
@@ -72,6 +108,18 @@ class LookbackPutOption(AbstractOption):
         min_price = np.min(path)  # Prix minimum atteint
         return max(0, self.strike - min_price)  
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff de l'option lookback put pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff de l'option lookback put pour chaque chemin.
+        """
+        return np.maximum(self.strike - paths.min(axis=1), 0.0)
+
 class FloatingStrikeCallOption(AbstractOption):
     """
     Option call à strike flottant où le strike est basé sur la moyenne des prix du sous-jacent.
@@ -89,6 +137,18 @@ class FloatingStrikeCallOption(AbstractOption):
         floating_strike = np.mean(path)  # Strike basé sur la moyenne des prix
         return max(0, path[-1] - floating_strike)  # Payoff pour un call
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff d'une option call à strike flottant pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff d'une option call à strike flottant pour chaque chemin.
+        """
+        return np.maximum(paths[:, -1] - paths.mean(axis=1), 0.0)
+
 
 class FloatingStrikePutOption(AbstractOption):
     """
@@ -106,6 +166,18 @@ class FloatingStrikePutOption(AbstractOption):
         """
         floating_strike = np.mean(path)  # Strike basé sur la moyenne des prix
         return max(0, floating_strike - path[-1])  # Payoff pour un put
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff d'une option put à strike flottant pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff d'une option put à strike flottant pour chaque chemin.
+        """
+        return np.maximum(paths.mean(axis=1) - paths[:, -1], 0.0)
     
 class ForwardStartCallOption(AbstractOption):
     """
@@ -124,6 +196,18 @@ class ForwardStartCallOption(AbstractOption):
         forward_start_strike = path[0]  # Exemple : strike basé sur le premier prix
         return max(0, path[-1] - forward_start_strike)  # Payoff pour un call
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff d'une option call forward start pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff d'une option call forward start pour chaque chemin.
+        """
+        return np.maximum(paths[:, -1] - paths[:, 0], 0.0)
+
 
 class ForwardStartPutOption(AbstractOption):
     """
@@ -141,11 +225,25 @@ class ForwardStartPutOption(AbstractOption):
         """
         forward_start_strike = path[0]  # Exemple : strike basé sur le premier prix
         return max(0, forward_start_strike - path[-1])  # Payoff pour un put
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff d'une option put forward start pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff d'une option put forward start pour chaque chemin.
+        """
+        return np.maximum(paths[:, 0] - paths[:, -1], 0.0)
     
 class ChooserOption(AbstractOption):
     """
     Option chooser qui permet de choisir entre un call et un put à l'échéance.
     """
+    REQUIRES = ("final",)
+
     def payoff(self, path: np.ndarray) -> float:
         """
         Calcule le payoff d'une option chooser.
@@ -158,4 +256,29 @@ class ChooserOption(AbstractOption):
         """
         call_payoff = max(0, path[-1] - self.strike)  # Payoff pour un call
         put_payoff = max(0, self.strike - path[-1])  # Payoff pour un put
-        return max(call_payoff, put_payoff)  # Choix du meilleur payoff
\ No newline at end of file
+        return max(call_payoff, put_payoff)  # Choix du meilleur payoff
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff d'une option chooser pour l'ensemble des chemins simulés.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps + 1).
+
+        Returns:
+            np.ndarray: Le payoff d'une option chooser pour chaque chemin.
+        """
+        return self.payoff_from_reductions({"final": paths[:, -1]})
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff d'une option chooser à partir des prix finaux de chaque chemin.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, dont les prix finaux ("final").
+
+        Returns:
+            np.ndarray: Le payoff d'une option chooser pour chaque chemin.
+        """
+        payoffs = np.subtract(reductions["final"], self.strike, dtype=np.float64)
+        return np.abs(payoffs, out=payoffs)  # max(call, put) = |S_T - K|
@@ -5,12 +5,30 @@ class EuropeanCallOption(AbstractOption):
     """
     Classe représentant une option d'achat (call) européenne.
     """
+    REQUIRES = ("final",)
+
     def payoff(self, path : np.ndarray) -> float:
         return max(0, path[-1] - self.strike)
 
+    def payoff_batch(self, paths : np.ndarray) -> np.ndarray:
+        return self.payoff_from_reductions({"final": paths[:, -1]})
+
+    def payoff_from_reductions(self, reductions : dict) -> np.ndarray:
+        payoffs = np.subtract(reductions["final"], self.strike, dtype=np.float64)
+        return np.maximum(payoffs, 0.0, out=payoffs)
+
 class EuropeanPutOption(AbstractOption):
     """
     Classe représentant une option de vente (put) européenne.
     """
+    REQUIRES = ("final",)
+
     def payoff(self, path : np.ndarray) -> float:
         return max(0, self.strike - path[-1])
+
+    def payoff_batch(self, paths : np.ndarray) -> np.ndarray:
+        return self.payoff_from_reductions({"final": paths[:, -1]})
+
+    def payoff_from_reductions(self, reductions : dict) -> np.ndarray:
+        payoffs = np.subtract(self.strike, reductions["final"], dtype=np.float64)
+        return np.maximum(payoffs, 0.0, out=payoffs)
\ No newline at end of file
@@ -1,31 +1,55 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import numpy as np
 from ..abstract_derive import AbstractDerive
 from ..options.abstract_option import AbstractOption
+from ..options.vanilla_options import EuropeanCallOption, EuropeanPutOption
 
 class AbstractOptionStrategy(AbstractDerive):
     """
     Classe représentant une stratégie optionnelle composée de plusieurs options.
     """
-    def __init__(self, options: List[Tuple[AbstractOption, bool]] = None):
+    def __init__(self, options: List[Tuple[AbstractOption, Union[bool, float]]] = None):
         """
         Initialise une stratégie optionnelle.
 
         Args:
-            options (List[Tuple[AbstractOption, bool]]): Liste de tuples contenant une option et un booléen
-                indiquant si l'option est achetée (True) ou vendue (False).
+            options (List[Tuple[AbstractOption, Union[bool, float]]]): Liste de tuples contenant une option et
+                sa quantité signée (positive si l'option est achetée, négative si elle est vendue).
+                Un booléen est aussi accepté : achetée (True) ou vendue (False), pour une quantité de 1.
         """
-        self.options: List[Tuple[AbstractOption, bool]] = options if options is not None else []
+        self.options: List[Tuple[AbstractOption, float]] = []
+        self._legs_soa = None  # Jambes au format tableaux (strikes, quantités, calls), construites à la demande
+        for option, quantity in (options if options is not None else []):
+            self.add_option(option, quantity)
 
-    def add_option(self, option: AbstractOption, is_long: bool):
+    @staticmethod
+    def signed_quantity(is_long: bool, quantity: float = 1) -> float:
+        """
+        Convertit une position (achetée/vendue) et une quantité en quantité signée.
+
+        Args:
+            is_long (bool): Indique si l'option est achetée (True) ou vendue (False).
+            quantity (float): Nombre d'options de la jambe.
+
+        Returns:
+            float: La quantité signée de la jambe.
+        """
+        return quantity if is_long else -quantity
+
+    def add_option(self, option: AbstractOption, is_long: Union[bool, float], quantity: float = 1):
         """
         Ajoute une option à la stratégie.
 
         Args:
             option (AbstractOption): Une instance d'option à ajouter.
-            is_long (bool): Indique si l'option est achetée (True) ou vendue (False).
+            is_long (Union[bool, float]): Indique si l'option est achetée (True) ou vendue (False),
+                ou directement la quantité signée de la jambe.
+            quantity (float): Nombre d'options lorsque la position est donnée par un booléen. Par défaut, 1.
         """
+        if isinstance(is_long, (bool, np.bool_)):
+            is_long = self.signed_quantity(is_long, quantity)
         self.options.append((option, is_long))
+        self._legs_soa = None
 
     def payoff(self, path: np.ndarray) -> np.ndarray:
         """
@@ -38,9 +62,52 @@ class AbstractOptionStrategy(AbstractDerive):
             np.ndarray: Le payoff total de la stratégie pour chaque point du chemin.
         """
         total_payoff = 0
-        for option, is_long in self.options:
-            payoff = option.payoff(path)
-            total_payoff += payoff if is_long else -payoff
+        for option, quantity in self.options:
+            total_payoff += quantity * option.payoff(path)
+        return total_payoff
+
+    def get_legs_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retourne les jambes de la stratégie sous forme de tableaux parallèles, lorsqu'elles sont toutes
+        des options européennes de même maturité (cas des spreads, straddles, butterflies...).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Strikes, quantités signées et indicateurs call/put des jambes,
+                ou None si les jambes ne sont pas toutes des options européennes de même maturité.
+        """
+        if self._legs_soa is None:
+            legs = [option for option, _ in self.options]
+            vanilla = all(type(option) in (EuropeanCallOption, EuropeanPutOption) for option in legs)
+            if legs and vanilla and len({option.maturity for option in legs}) == 1:
+                self._legs_soa = (np.array([option.strike for option in legs], dtype=np.float64),
+                                  np.array([quantity for _, quantity in self.options], dtype=np.float64),
+                                  np.array([isinstance(option, EuropeanCallOption) for option in legs]))
+            else:
+                self._legs_soa = ()
+        return self._legs_soa or None
+
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff total de la stratégie pour l'ensemble des chemins simulés.
+        Les jambes européennes de même maturité sont évaluées en une seule expression vectorisée.
+
+        Args:
+            paths (np.ndarray): Chemins simulés des prix ou des valeurs sous-jacentes.
+
+        Returns:
+            np.ndarray: Le payoff total de la stratégie pour chaque chemin.
+        """
+        legs = self.get_legs_arrays()
+        if legs is not None:
+            strikes, quantities, is_call = legs
+            final_prices = np.asarray(paths, dtype=np.float64)[:, -1, np.newaxis]
+            intrinsic = np.where(is_call, final_prices - strikes, strikes - final_prices)
+            np.maximum(intrinsic, 0.0, out=intrinsic)
+            return intrinsic @ quantities
+
+        total_payoff = np.zeros(len(paths))
+        for option, quantity in self.options:
+            total_payoff += quantity * option.payoff_batch(paths)
         return total_payoff
 
     def __str__(self) -> str:
@@ -51,4 +118,4 @@ class AbstractOptionStrategy(AbstractDerive):
             str: Description de la stratégie et des options qu'elle contient.
         """
         return f"AbstractOptionStrategy avec {len(self.options)} options: " + \
-               f"{[(str(option), is_long) for option, is_long in self.options]}"
+               f"{[(str(option), quantity) for option, quantity in self.options]}"
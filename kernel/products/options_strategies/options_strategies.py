@@ -95,14 +95,13 @@ class ButterflySpread(AbstractOptionStrategy):
         :param position_high: Position sur l'option avec strike_high (True pour long, False pour short).
         """
         self.call_low = EuropeanCallOption(maturity, strike_low)
-        self.call_mid1 = EuropeanCallOption(maturity, strike_mid)
-        self.call_mid2 = EuropeanCallOption(maturity, strike_mid)
+        # Les deux options du milieu sont identiques : une seule jambe de quantité 2
+        self.call_mid = EuropeanCallOption(maturity, strike_mid)
         self.call_high = EuropeanCallOption(maturity, strike_high)
         super().__init__([
-            (self.call_low, position_low),
-            (self.call_mid1, position_mid),
-            (self.call_mid2, position_mid),
-            (self.call_high, position_high)
+            (self.call_low, self.signed_quantity(position_low)),
+            (self.call_mid, self.signed_quantity(position_mid, 2)),
+            (self.call_high, self.signed_quantity(position_high))
         ])
 
 class CondorSpread(AbstractOptionStrategy):
@@ -190,12 +189,10 @@ class Strip(AbstractOptionStrategy):
         :param position_put: Position sur les options put (True pour long, False pour short).
         """
         call = EuropeanCallOption(maturity, strike)
-        put1 = EuropeanPutOption(maturity, strike)
-        put2 = EuropeanPutOption(maturity, strike)
+        put = EuropeanPutOption(maturity, strike)
         super().__init__([
-            (call, position_call),
-            (put1, position_put),
-            (put2, position_put)
+            (call, self.signed_quantity(position_call)),
+            (put, self.signed_quantity(position_put, 2))
         ])
 
 class Strap(AbstractOptionStrategy):
@@ -213,12 +210,10 @@ class Strap(AbstractOptionStrategy):
         :param position_call: Position sur les options call (True pour long, False pour short).
         :param position_put: Position sur l'option put (True pour long, False pour short).
         """
-        call1 = EuropeanCallOption(maturity, strike)
-        call2 = EuropeanCallOption(maturity, strike)
+        call = EuropeanCallOption(maturity, strike)
         put = EuropeanPutOption(maturity, strike)
         super().__init__([
-            (call1, position_call),
-            (call2, position_call),
-            (put, position_put)
+            (call, self.signed_quantity(position_call, 2)),
+            (put, self.signed_quantity(position_put))
         ])
 
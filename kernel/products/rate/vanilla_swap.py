@@ -41,16 +41,16 @@ class InterestRateSwap(AbstractRateProduct):
         float_leg_pv = self.float_leg_value()
         return float_leg_pv - fixed_leg_pv
 
+    def get_accrual_fractions(self) -> np.ndarray:
+        # Payment dates are all after the valuation date: each period accrues from the previous one (or from the start)
+        return self.day_counter.get_year_fractions([self.start] + self.dates[:-1], self.dates)
+
     def get_annuities(self)-> float:
         annuities = 0
-        prev_date = self.start
-        for d in self.dates:
-            if d > self.date:
-                yf = self.day_counter.get_year_fraction(prev_date, d)
-                t = (d - self.date).days / 365
-                df = self.market.get_discount_factor(t)
-                annuities += yf * df
-                prev_date = d
+        for d, yf in zip(self.dates, self.get_accrual_fractions().tolist()):
+            t = (d - self.date).days / 365
+            df = self.market.get_discount_factor(t)
+            annuities += yf * df
         return annuities
     
     def fixed_leg_value(self)-> float:
@@ -59,22 +59,20 @@ class InterestRateSwap(AbstractRateProduct):
     def float_leg_value(self)-> float:
         pv = 0
         prev_date = self.start
-        for d in self.dates:
-            if d > self.date:
-                t1 = (prev_date - self.date).days / 365
-                t2 = (d - self.date).days / 365
-                yf = self.day_counter.get_year_fraction(prev_date, d)
-
-                if t1 <= 0:
-                    forward_rate = self.market.get_rate(t2) / 100
-                else:
-                    forward_rate = self.market.get_fwd_rate(t1, t2)
-
-                forward_rate += self.float_spread / 10000.0
-                df = self.market.get_discount_factor(t2)
-                cashflow = self.notional * forward_rate * yf
-                pv += cashflow * df
-                prev_date = d
+        for d, yf in zip(self.dates, self.get_accrual_fractions().tolist()):
+            t1 = (prev_date - self.date).days / 365
+            t2 = (d - self.date).days / 365
+
+            if t1 <= 0:
+                forward_rate = self.market.get_rate(t2) / 100
+            else:
+                forward_rate = self.market.get_fwd_rate(t1, t2)
+
+            forward_rate += self.float_spread / 10000.0
+            df = self.market.get_discount_factor(t2)
+            cashflow = self.notional * forward_rate * yf
+            pv += cashflow * df
+            prev_date = d
         return pv
 
 
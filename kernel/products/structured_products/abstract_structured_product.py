@@ -5,6 +5,9 @@ class AbstractStructuredProduct(ABC):
     """
     Classe abstraite représentant un produit structuré.
     """
+    # Réductions des chemins simulés nécessaires au payoff ("path" : chemins complets)
+    REQUIRES = ("path",)
+
     def __init__(self, maturity : float):
         self.validate_inputs(maturity)
         self.maturity = maturity
@@ -36,6 +39,31 @@ class AbstractStructuredProduct(ABC):
         """
         pass
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff du produit structuré pour l'ensemble des chemins simulés.
+        Implémentation par défaut appliquant le payoff chemin par chemin.
+
+        Args:
+            paths (np.ndarray): Chemins simulés des prix des sous-jacents.
+
+        Returns:
+            np.ndarray: Le payoff du produit structuré pour chaque chemin.
+        """
+        return np.fromiter((self.payoff(path) for path in paths), dtype=np.float64, count=len(paths))
+
+    def payoff_from_reductions(self, reductions: dict) -> np.ndarray:
+        """
+        Calcule le payoff du produit structuré à partir des réductions des chemins simulés listées dans REQUIRES.
+
+        Args:
+            reductions (dict): Réductions des chemins simulés, indexées par nom.
+
+        Returns:
+            np.ndarray: Le payoff du produit structuré pour chaque chemin.
+        """
+        return self.payoff_batch(reductions["path"])
+
     # @abstractmethod
     def description(self) -> str:
         """
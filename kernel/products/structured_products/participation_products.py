@@ -1,4 +1,5 @@
 import numpy as np
+from typing import Optional
 from .abstract_structured_product import AbstractStructuredProduct
 
 class AbstractParticipationProduct(AbstractStructuredProduct):
@@ -18,27 +19,34 @@ class AbstractParticipationProduct(AbstractStructuredProduct):
         super().__init__(maturity)
         self.rebate: float = rebate
         self.leverage: float = leverage
+        # Constantes du payoff (base 100) précalculées une fois pour toutes
+        self._rebate_payoff: float = 100 + rebate
+        self._leverage_pct: float = 100 * leverage
 
 class TwinWin(AbstractParticipationProduct):
     """
     Produit structuré Twin Win avec barrières supérieure et inférieure, rebate et levier.
     """
-    def __init__(self, maturity: float, upper_barrier: float, lower_barrier: float, rebate: float = 0, leverage: float = 100):
+    def __init__(self, maturity: float, upper_barrier: Optional[float], lower_barrier: float, rebate: float = 0, leverage: float = 100):
         """
         Initialise un produit Twin Win.
 
         Args:
             maturity (float): Maturité du produit.
-            upper_barrier (float): Barrière supérieure.
+            upper_barrier (Optional[float]): Barrière supérieure. None pour un produit sans barrière supérieure.
             lower_barrier (float): Barrière inférieure.
             rebate (float, optional): Remboursement fixe si la barrière supérieure est franchie. Par défaut, 0.
             leverage (float, optional): Facteur de levier. Par défaut, 1.
         """
         super().__init__(maturity = maturity, rebate=rebate, leverage=leverage)
-        if upper_barrier <= lower_barrier:
+        if upper_barrier is not None and upper_barrier <= lower_barrier:
             raise ValueError("La barrière supérieure doit être strictement supérieure à la barrière inférieure.")
         self.upper_barrier = upper_barrier
         self.lower_barrier = lower_barrier
+        self._has_upper: bool = upper_barrier is not None
+        # Barrières exprimées en ratio final / initial, pour comparer directement la performance brute
+        self._upper_ratio: float = upper_barrier / 100 if self._has_upper else np.inf
+        self._lower_ratio: float = lower_barrier / 100
 
     def payoff(self, paths: np.ndarray) -> float:
         """
@@ -52,26 +60,47 @@ class TwinWin(AbstractParticipationProduct):
         """
         final_price: float = paths[-1] # Prix final du sous-jacent
         initial_price : float = paths[0]  # Prix inital du sous-jacent
-        performance: float = (final_price / initial_price) * 100
+        ratio: float = final_price / initial_price
         payoff = 100
         # Si la barrière supérieure est franchie
-        if performance > self.upper_barrier:
-            payoff = 100 + self.rebate  # Remboursement fixe
+        if self._has_upper and ratio > self._upper_ratio:
+            payoff = self._rebate_payoff  # Remboursement fixe
         # Si la barrière inférieure est franchie
-        elif performance < self.lower_barrier:
+        elif ratio < self._lower_ratio:
             # Perte similaire à un Put Down-and-In
-            loss = self.leverage * (performance - 100)
+            loss = self._leverage_pct * (ratio - 1)
             payoff =  100 + loss  # Perte
         else:
             # Participation dans la plage définie par les barrières
-            payoff = self.leverage * abs(performance - 100) + 100
+            payoff = self._leverage_pct * abs(ratio - 1) + 100
 
         return payoff
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff du Twin Win pour l'ensemble des chemins simulés en une seule passe vectorisée.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps).
+
+        Returns:
+            np.ndarray: Les payoffs du Twin Win pour chaque chemin.
+        """
+        ratio = paths[:, -1] / paths[:, 0]
+        excess = ratio - 1
+        # Participation à la valeur absolue de la performance, sauf sous la barrière inférieure où la perte garde son signe
+        payoffs = np.abs(excess)
+        np.copyto(payoffs, excess, where=ratio < self._lower_ratio)
+        np.multiply(payoffs, self._leverage_pct, out=payoffs)
+        np.add(payoffs, 100, out=payoffs)
+        if self._has_upper:
+            payoffs[ratio > self._upper_ratio] = self._rebate_payoff  # Remboursement fixe
+        return payoffs
+
     def description(self) -> str:
-        if self.upper_barrier:
+        if self.upper_barrier is not None:
             return (f"Twin Win avec barrière supérieure à {self.upper_barrier}, barrière inférieure à {self.lower_barrier}, "
-                     "rebate de {self.rebate}, et levier de {self.leverage}.")
+                    f"rebate de {self.rebate}, et levier de {self.leverage}.")
         else:
             return (f"Twin Win sans barrière supérieure capante, barrière inférieure à {self.lower_barrier}, "
                     f"rebate de {self.rebate}, et levier de {self.leverage}.")
@@ -81,23 +110,27 @@ class Airbag(AbstractParticipationProduct):
     """
     Produit structuré AirBag avec barrières supérieure et inférieure, rebate et levier.
     """
-    def __init__(self, maturity: float, upper_barrier: float, lower_barrier: float, rebate: float = 0, leverage: float = 1):
+    def __init__(self, maturity: float, upper_barrier: Optional[float], lower_barrier: float, rebate: float = 0, leverage: float = 1):
         """
         Initialise un produit AirBag.
 
         Args:
             maturity (float): Maturité du produit.
             notional (float): Nominal du produit.
-            upper_barrier (float): Barrière supérieure.
+            upper_barrier (Optional[float]): Barrière supérieure. None pour un produit sans barrière supérieure.
             lower_barrier (float): Barrière inférieure.
             rebate (float, optional): Remboursement fixe si la barrière supérieure est franchie. Par défaut, 0.
             leverage (float, optional): Facteur de levier. Par défaut, 1.
         """
         super().__init__(maturity = maturity, rebate=rebate, leverage=leverage)
-        if upper_barrier <= lower_barrier:
+        if upper_barrier is not None and upper_barrier <= lower_barrier:
             raise ValueError("La barrière supérieure doit être strictement supérieure à la barrière inférieure.")
         self.upper_barrier = upper_barrier
         self.lower_barrier = lower_barrier
+        self._has_upper: bool = upper_barrier is not None
+        # Barrières exprimées en ratio final / initial, pour comparer directement la performance brute
+        self._upper_ratio: float = upper_barrier / 100 if self._has_upper else np.inf
+        self._lower_ratio: float = lower_barrier / 100
 
     def payoff(self, paths: np.ndarray) -> float:
         """
@@ -111,26 +144,44 @@ class Airbag(AbstractParticipationProduct):
         """
         final_price: float = paths[-1]  # Prix final du sous-jacent
         initial_price: float = paths[0]
-        performance: float =  (final_price / initial_price) * 100
+        ratio: float =  final_price / initial_price
         payoff = 100
         # Si la barrière supérieure est franchie
-        if performance > self.upper_barrier:
-            payoff =  100 + self.rebate  # Remboursement fixe
+        if self._has_upper and ratio > self._upper_ratio:
+            payoff =  self._rebate_payoff  # Remboursement fixe
         # Si la barrière inférieure est franchie
-        elif performance < self.lower_barrier:
+        elif ratio < self._lower_ratio:
             # Perte similaire à un Put Down-and-In
-            loss = self.leverage  * (performance - 100)
+            loss = self._leverage_pct  * (ratio - 1)
             payoff = loss + 100  # Perte
-        elif performance < 100:
+        elif ratio < 1:
             payoff =  100
         else:
             # Participation dans la plage définie par les barrières
-            payoff = self.leverage * (performance - 100) + 100
+            payoff = self._leverage_pct * (ratio - 1) + 100
 
         return payoff
 
+    def payoff_batch(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calcule le payoff du Airbag pour l'ensemble des chemins simulés en une seule passe vectorisée.
+
+        Args:
+            paths (np.ndarray): Chemins des prix du sous-jacent de forme (n_paths, n_steps).
+
+        Returns:
+            np.ndarray: Les payoffs du Airbag pour chaque chemin.
+        """
+        ratio = paths[:, -1] / paths[:, 0]
+        participation = self._leverage_pct * (ratio - 1) + 100
+        # La présence de la barrière supérieure est tranchée une fois par lot, pas chemin par chemin
+        conditions, choices = [ratio < self._lower_ratio, ratio < 1], [participation, 100]
+        if self._has_upper:
+            conditions, choices = [ratio > self._upper_ratio] + conditions, [self._rebate_payoff] + choices
+        return np.select(conditions, choices, default=participation)
+
     def description(self) -> str:
-        if self.upper_barrier:
+        if self.upper_barrier is not None:
             return (f"Airbag avec barrière supérieure à {self.upper_barrier}, barrière inférieure à {self.lower_barrier}, "
                     f"rebate de {self.rebate}, et levier de {self.leverage}.")
         else:
@@ -1,6 +1,17 @@
 import unittest
 import numpy as np
 from kernel.products import *
+from kernel.models.discritization_schemes.path_reducer import PathReducer
+from kernel.tools import CalendarConvention, Model, RateCurveType, ObservationFrequency
+from kernel.market_data import Market, InterpolationType, VolatilitySurfaceType
+from kernel.models.pricing_engines.mc_pricing_engine import MCPricingEngine
+from utils.pricing_settings import PricingSettings
+from utils.day_counter import DayCounter
+from kernel.market_data.volatility_surface import SVIVolatilitySurface, SSVIVolatilitySurface
+from kernel.models.stochastic_processes.black_scholes_process import BlackScholesProcess
+from kernel.models.stochastic_processes.heston_process import HestonProcess
+from kernel.market_data.market import _LRUCache
+from datetime import date
 
 
 class TestBarrierOptions(unittest.TestCase):
@@ -55,6 +66,38 @@ class TestBarrierOptions(unittest.TestCase):
         self.assertEqual(option.payoff(self.path_below_barrier_down), max(0, self.strike - self.path_below_barrier_down[-1]))
         self.assertEqual(option.payoff(self.path_above_barrier_down), 0)
 
+    def test_payoff_batch(self):
+        up_paths = np.array([self.path_below_barrier_up, self.path_above_barrier_up])
+        down_paths = np.array([self.path_below_barrier_down, self.path_above_barrier_down])
+        # Payoffs attendus pour le chemin qui ne franchit pas la barrière puis pour celui qui la franchit
+        options = [
+            (UpAndOutCallOption(self.maturity, self.strike, self.barrier_up), up_paths, [5, 0]),
+            (UpAndInCallOption(self.maturity, self.strike, self.barrier_up), up_paths, [0, 15]),
+            (UpAndInPutOption(self.maturity, self.strike, self.barrier_up), up_paths, [0, 0]),
+            (UpAndOutPutOption(self.maturity, self.strike, self.barrier_up), up_paths, [0, 0]),
+            (DownAndInCallOption(self.maturity, self.strike, self.barrier_down), down_paths, [0, 0]),
+            (DownAndOutCallOption(self.maturity, self.strike, self.barrier_down), down_paths, [5, 0]),
+            (DownAndInPutOption(self.maturity, self.strike, self.barrier_down), down_paths, [0, 15]),
+            (DownAndOutPutOption(self.maturity, self.strike, self.barrier_down), down_paths, [0, 0]),
+        ]
+        for option, paths, expected_payoffs in options:
+            payoffs = option.payoff_batch(paths)
+            np.testing.assert_array_equal(payoffs, expected_payoffs)
+            np.testing.assert_array_equal(payoffs, [option.payoff(path) for path in paths])
+
+    def test_payoff_from_reductions(self):
+        paths = np.array([self.path_below_barrier_up, self.path_above_barrier_up,
+                          self.path_below_barrier_down, self.path_above_barrier_down], dtype=float)
+        options = [UpAndOutCallOption(self.maturity, self.strike, self.barrier_up),
+                   DownAndInPutOption(self.maturity, self.strike, self.barrier_down)]
+        for option in options:
+            # Réduction pas à pas, comme lors de la simulation
+            reducer = PathReducer(option.REQUIRES)
+            for step in range(paths.shape[1]):
+                reducer.update(paths[:, step])
+            reductions = reducer.finalize(paths[:, -1])
+            np.testing.assert_array_equal(option.payoff_from_reductions(reductions), option.payoff_batch(paths))
+
 class TestCallPutOptions(unittest.TestCase):
     def setUp(self):
         # Initialisation des paramètres communs
@@ -74,6 +117,12 @@ class TestCallPutOptions(unittest.TestCase):
         self.assertEqual(option.payoff(self.path_above_strike), 0)
         self.assertEqual(option.payoff(self.path_below_strike), max(0, self.strike - self.path_below_strike[-1]))
 
+    def test_european_payoff_batch(self):
+        paths = np.array([self.path_above_strike, self.path_below_strike])
+        for option in [EuropeanCallOption(self.maturity, self.strike), EuropeanPutOption(self.maturity, self.strike)]:
+            expected_payoffs = [option.payoff(path) for path in paths]
+            np.testing.assert_array_equal(option.payoff_batch(paths), expected_payoffs)
+
     def test_binary_call_option(self):
         option = BinaryCallOption(self.maturity, self.strike, self.coupon)
         self.assertEqual(option.payoff(self.path_above_strike), self.coupon)  # Payoff = 1 si le prix final est au-dessus du strike
@@ -84,6 +133,12 @@ class TestCallPutOptions(unittest.TestCase):
         self.assertEqual(option.payoff(self.path_above_strike), 0)  # Payoff = 0 si le prix final est au-dessus du strike
         self.assertEqual(option.payoff(self.path_below_strike), self.coupon)  # Payoff = 1 sinon
 
+    def test_binary_payoff_batch(self):
+        paths = np.array([self.path_above_strike, self.path_below_strike])
+        for option in [BinaryCallOption(self.maturity, self.strike, self.coupon), BinaryPutOption(self.maturity, self.strike, self.coupon)]:
+            expected_payoffs = [option.payoff(path) for path in paths]
+            np.testing.assert_array_equal(option.payoff_batch(paths), expected_payoffs)
+
 class TestPathDependantOptions(unittest.TestCase):
     def setUp(self):
         # Initialisation des paramètres communs
@@ -145,6 +200,17 @@ class TestPathDependantOptions(unittest.TestCase):
         put_payoff = max(0, self.strike - self.path[-1])
         expected_payoff = max(call_payoff, put_payoff)  # Choix du meilleur payoff
         self.assertEqual(option.payoff(self.path), expected_payoff)
+        paths = np.array([self.path, self.path[::-1]])
+        np.testing.assert_array_equal(option.payoff_from_reductions({"final": paths[:, -1]}), option.payoff_batch(paths))
+
+    def test_path_dependant_payoff_batch(self):
+        paths = np.array([self.path, self.path[::-1], np.full(5, self.strike)])
+        for option_class in [AsianCallOption, AsianPutOption, LookbackCallOption, LookbackPutOption,
+                             FloatingStrikeCallOption, FloatingStrikePutOption, ForwardStartCallOption,
+                             ForwardStartPutOption, ChooserOption]:
+            option = option_class(self.maturity, self.strike)
+            expected_payoffs = [option.payoff(path) for path in paths]
+            np.testing.assert_allclose(option.payoff_batch(paths), expected_payoffs)
 
 class TestMultiAssetOptions(unittest.TestCase):
     def setUp(self):
@@ -174,6 +240,15 @@ class TestMultiAssetOptions(unittest.TestCase):
         expected_payoff = max(0, self.strike - basket_price)
         self.assertEqual(option.payoff(self.paths), expected_payoff)
 
+    def test_basket_default_weights(self):
+        option = BasketCallOption(self.maturity, self.strike)
+        expected_payoff = max(0, np.mean(self.paths[:, -1]) - self.strike)
+        self.assertAlmostEqual(option.payoff(self.paths), expected_payoff)
+        self.assertIsNone(option.weights)  # Le calcul ne modifie pas l'état de l'option
+        option = BasketCallOption(self.maturity, self.strike, n_assets=3)
+        np.testing.assert_allclose(option.weights, np.ones(3) / 3)
+        self.assertAlmostEqual(option.payoff(self.paths), expected_payoff)
+
     def test_best_of_call_option(self):
         option = BestOfCallOption(self.maturity, self.strike)
         best_performance = np.max(self.paths[:, -1])  # Meilleur prix final parmi les sous-jacents
@@ -198,6 +273,30 @@ class TestMultiAssetOptions(unittest.TestCase):
         expected_payoff = max(0, self.strike - worst_performance)
         self.assertEqual(option.payoff(self.paths), expected_payoff)
 
+    def test_multi_asset_payoff_batch(self):
+        batch_paths = np.array([self.paths, self.paths * 0.9, self.paths * 1.1])  # (n_paths, n_assets, n_steps)
+        options = [
+            BasketCallOption(self.maturity, self.strike, weights=self.weights),
+            BasketPutOption(self.maturity, self.strike, weights=self.weights),
+            BestOfCallOption(self.maturity, self.strike),
+            BestOfPutOption(self.maturity, self.strike),
+            WorstOfCallOption(self.maturity, self.strike),
+            WorstOfPutOption(self.maturity, self.strike),
+        ]
+        for option in options:
+            expected_payoffs = [option.payoff(paths) for paths in batch_paths]
+            np.testing.assert_allclose(option.payoff_batch(batch_paths), expected_payoffs)
+
+    def test_mc_pricing_engine_basket(self):
+        # Le moteur ne simule qu'un seul sous-jacent : les prix finaux par sous-jacent ne peuvent pas être fournis
+        settings = PricingSettings(underlying_name="SPX", rate_curve_type=RateCurveType.RF_US_TREASURY,
+                                   interpolation_type=InterpolationType.CUBIC, volatility_surface_type=VolatilitySurfaceType.SVI,
+                                   obs_frequency=ObservationFrequency.ANNUAL, day_count_convention=CalendarConvention.ACT_360,
+                                   model=Model.BLACK_SCHOLES, nb_paths=100, nb_steps=10)
+        engine = MCPricingEngine(Market("SPX", volatility_surface_type=VolatilitySurfaceType.SVI), settings)
+        with self.assertRaisesRegex(ValueError, "final_per_asset"):
+            engine.get_results(BasketCallOption(self.maturity, 5768, weights=self.weights))
+
 class TestOptionStrategies(unittest.TestCase):
     def setUp(self):
         # Initialisation des paramètres communs
@@ -249,6 +348,20 @@ class TestOptionStrategies(unittest.TestCase):
         expected_payoff = call_low_payoff + call_mid1_payoff + call_mid2_payoff + call_high_payoff
         self.assertEqual(strategy.payoff(self.path), expected_payoff)
 
+    def test_strategy_payoff_batch(self):
+        paths = np.array([self.path, self.path[::-1], np.full(4, self.strike_mid1)])
+        strategies = [
+            ButterflySpread(self.maturity, self.strike_low, self.strike_mid1, self.strike_high,
+                            position_low=True, position_mid=False, position_high=True),
+            CondorSpread(self.maturity, self.strike_low, self.strike_mid1, self.strike_mid2, self.strike_high,
+                         position_low=True, position_mid1=False, position_mid2=False, position_high=True),
+            Straddle(self.maturity, self.strike, position_call=True, position_put=False),
+        ]
+        for strategy in strategies:
+            self.assertIsNotNone(strategy.get_legs_arrays())
+            expected_payoffs = [strategy.payoff(path) for path in paths]
+            np.testing.assert_allclose(strategy.payoff_batch(paths), expected_payoffs)
+
     def test_condor_spread(self):
         strategy = CondorSpread(self.maturity, self.strike_low, self.strike_mid1, self.strike_mid2, self.strike_high,
                                  position_low=True, position_mid1=False, position_mid2=False, position_high=True)
@@ -275,5 +388,123 @@ class TestOptionStrategies(unittest.TestCase):
         expected_payoff = call_payoff + put_payoff
         self.assertEqual(strategy.payoff(self.path), expected_payoff)
 
+class TestParticipationProducts(unittest.TestCase):
+    def setUp(self):
+        # Initialisation des paramètres communs
+        self.maturity = 1.0
+        self.upper_barrier = 120
+        self.lower_barrier = 80
+        self.rebate = 5
+        self.leverage = 1.5
+        self.paths = np.array([
+            [100, 110, 130],  # Barrière supérieure franchie
+            [100, 105, 110],  # Participation à la hausse
+            [100, 95, 90],    # Baisse entre les barrières
+            [100, 80, 70],    # Barrière inférieure franchie
+        ])
+
+    def test_twin_win_payoff_batch(self):
+        product = TwinWin(self.maturity, self.upper_barrier, self.lower_barrier, self.rebate, self.leverage)
+        expected_payoffs = [product.payoff(path) for path in self.paths]
+        np.testing.assert_array_equal(product.payoff_batch(self.paths), expected_payoffs)
+
+    def test_airbag_payoff_batch(self):
+        product = Airbag(self.maturity, self.upper_barrier, self.lower_barrier, self.rebate, self.leverage)
+        expected_payoffs = [product.payoff(path) for path in self.paths]
+        np.testing.assert_array_equal(product.payoff_batch(self.paths), expected_payoffs)
+
+    def test_without_upper_barrier(self):
+        for product_class in [TwinWin, Airbag]:
+            capped = product_class(self.maturity, self.upper_barrier, self.lower_barrier, self.rebate, self.leverage)
+            uncapped = product_class(self.maturity, None, self.lower_barrier, self.rebate, self.leverage)
+            self.assertIn("sans barrière supérieure", uncapped.description())
+            expected_payoffs = [uncapped.payoff(path) for path in self.paths]
+            np.testing.assert_array_equal(uncapped.payoff_batch(self.paths), expected_payoffs)
+            # Seul le chemin franchissant la barrière supérieure diffère du produit capé
+            np.testing.assert_array_equal(uncapped.payoff_batch(self.paths)[1:], capped.payoff_batch(self.paths)[1:])
+            self.assertNotEqual(uncapped.payoff(self.paths[0]), capped.payoff(self.paths[0]))
+
+    def test_airbag_capital_protection(self):
+        product = Airbag(self.maturity, self.upper_barrier, self.lower_barrier, self.rebate, self.leverage)
+        protected_path = self.paths[2]  # Baisse entre les barrières : capital protégé
+        self.assertEqual(product.payoff(protected_path), 100)
+        payoffs = product.payoff_batch(self.paths)
+        self.assertEqual(payoffs.dtype, np.float64)
+        self.assertEqual(payoffs[2], 100)
+
+class TestDayCounter(unittest.TestCase):
+    def setUp(self):
+        # Périodes couvrant les fins de mois, les années bissextiles et plusieurs années civiles
+        self.start_dates = [date(2023, 1, 31), date(2024, 2, 29), date(2023, 12, 15), date(2024, 5, 30), date(2020, 3, 1)]
+        self.end_dates = [date(2023, 3, 31), date(2025, 2, 28), date(2024, 1, 15), date(2024, 5, 30), date(2026, 8, 31)]
+
+    def test_year_fractions(self):
+        for convention in CalendarConvention:
+            day_counter = DayCounter(convention.value)
+            expected_fractions = [day_counter.get_year_fraction(start, end) for start, end in zip(self.start_dates, self.end_dates)]
+            np.testing.assert_array_equal(day_counter.get_year_fractions(self.start_dates, self.end_dates), expected_fractions)
+
+    def test_year_fractions_invalid_period(self):
+        with self.assertRaises(ValueError):
+            DayCounter(CalendarConvention.ACT_360.value).get_year_fractions([date(2024, 2, 1)], [date(2024, 1, 1)])
+
+class TestVolatilitySurfaceGradients(unittest.TestCase):
+    def setUp(self):
+        self.maturities = np.array([0.1, 0.5, 1.0, 2.0, 5.0])
+        self.k = np.linspace(-0.5, 0.5, 5)
+        self.eps = 1e-6
+
+    def assert_jacobian(self, function, jacobian, x, params):
+        # Différences finies centrées sur chaque paramètre
+        expected = np.stack([(function(x, params + self.eps * e) - function(x, params - self.eps * e)) / (2 * self.eps) for e in np.eye(len(params))])
+        np.testing.assert_allclose(jacobian, expected, rtol=1e-5, atol=1e-8)
+
+    def test_atm_variance_jacobian(self):
+        params = np.array([1.5, 0.04, 0.02])
+        jacobian = SSVIVolatilitySurface._ssvi_atm_variance_jacobian(self.maturities, params)
+        self.assert_jacobian(SSVIVolatilitySurface._ssvi_atm_variance, jacobian, self.maturities, params)
+
+    def test_total_variance_jacobian(self):
+        params = np.array([-0.6, 0.8, 0.4])
+        atm_variance = 0.04 * self.maturities
+        total_variance, jacobian = SSVIVolatilitySurface._ssvi_total_variance_and_jacobian(self.k, atm_variance, params)
+        np.testing.assert_allclose(total_variance, SSVIVolatilitySurface._ssvi_total_variance(self.k, atm_variance, params), rtol=1e-14)
+        self.assert_jacobian(lambda k, p: SSVIVolatilitySurface._ssvi_total_variance(k, atm_variance, p), jacobian, self.k, params)
+
+    def test_svi_total_variance_jacobian(self):
+        params = np.array([0.02, 0.1, -0.5, 0.05, 0.2])
+        jacobian = SVIVolatilitySurface.svi_total_variance_jacobian(self.k, params)
+        self.assert_jacobian(SVIVolatilitySurface.svi_total_variance, jacobian, self.k, params)
+
+class TestAntitheticIncrements(unittest.TestCase):
+    def setUp(self):
+        self.drift = np.full(10, 0.02)
+        self.nb_paths = 7  # Nombre impair : le dernier tirage n'a pas de chemin opposé
+
+    def assert_antithetic(self, dW):
+        half = (self.nb_paths + 1) // 2
+        np.testing.assert_array_equal(dW[half:], -dW[:self.nb_paths - half])
+
+    def test_black_scholes_increments(self):
+        process = BlackScholesProcess(S0=100, T=1.0, nb_steps=10, drift=self.drift, volatility=0.2)
+        dW = process.get_random_increments(self.nb_paths, antithetic=True)
+        self.assertEqual(dW.shape, (self.nb_paths, 10))
+        self.assert_antithetic(dW)
+        np.testing.assert_array_equal(dW[:4], process.get_random_increments(4))
+
+    def test_heston_increments(self):
+        process = HestonProcess(S0=100, v0=0.04, T=1.0, nb_steps=10, drift=self.drift, kappa=1.5, theta=0.04, sigma=0.3, rho=-0.7)
+        for dW in process.get_random_increments(self.nb_paths, antithetic=True):
+            self.assert_antithetic(dW)
+
+class TestLRUCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = _LRUCache(maxsize=2)
+        cache[1], cache[2] = 1.0, 2.0
+        self.assertEqual(cache.get(1), 1.0)  # 1 devient la clé la plus récemment utilisée
+        cache[3] = 3.0
+        self.assertEqual(list(cache), [1, 3])
+        self.assertIsNone(cache.get(2))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,11 @@
 from kernel.tools import CalendarConvention 
 from datetime import date,datetime
+from typing import Sequence
+import numpy as np
+
+# Year basis of the conventions counting actual days over a fixed number of days per year
+_DAYS_PER_YEAR = {CalendarConvention.ACT_360.value: 360.0, CalendarConvention.ACT_365.value: 365.0}
+
 class DayCounter:
     def __init__(self, convention: CalendarConvention):
         self.convention = convention
@@ -8,12 +14,9 @@ class DayCounter:
         if start_date > end_date:
             raise ValueError("start_date must be before end_date")
 
-        delta_days = (end_date - start_date).days
-
-        if self.convention == CalendarConvention.ACT_360.value:
-            return delta_days / 360.0
-        elif self.convention == CalendarConvention.ACT_365.value:
-            return delta_days / 365.0
+        days_per_year = _DAYS_PER_YEAR.get(self.convention)
+        if days_per_year is not None:
+            return (end_date - start_date).days / days_per_year
         elif self.convention == CalendarConvention.ACT_ACT.value:
             return self._actual_actual(start_date, end_date)
         elif self.convention == CalendarConvention.THIRTY_360.value:
@@ -21,6 +24,58 @@ class DayCounter:
         else:
             raise NotImplementedError(f"Convention {self.convention} not implemented")
 
+    def get_year_fractions(self, start_dates: Sequence[date], end_dates: Sequence[date]) -> np.ndarray:
+        """
+        Vectorized version of get_year_fraction for a whole schedule: the convention is resolved once
+        and the fractions are computed on datetime64[D] arrays instead of looping over the periods.
+        """
+        start_days = np.asarray(start_dates, dtype="datetime64[D]")
+        end_days = np.asarray(end_dates, dtype="datetime64[D]")
+        if np.any(start_days > end_days):
+            raise ValueError("start_date must be before end_date")
+
+        delta_days = (end_days - start_days).astype(np.int64)
+
+        days_per_year = _DAYS_PER_YEAR.get(self.convention)
+        if days_per_year is not None:
+            return delta_days / days_per_year
+        elif self.convention == CalendarConvention.ACT_ACT.value:
+            return self._actual_actual_vec(start_days, end_days)
+        elif self.convention == CalendarConvention.THIRTY_360.value:
+            return self._thirty_360_vec(start_days, end_days)
+        else:
+            raise NotImplementedError(f"Convention {self.convention} not implemented")
+
+    @staticmethod
+    def _split_dates(days: np.ndarray) -> tuple:
+        """
+        Splits datetime64[D] dates into their year, month and day components.
+        """
+        months = days.astype("datetime64[M]")
+        years = days.astype("datetime64[Y]")
+        return (years.astype(np.int64) + 1970, (months - years.astype("datetime64[M]")).astype(np.int64) + 1,
+                (days - months.astype("datetime64[D]")).astype(np.int64) + 1)
+
+    def _actual_actual_vec(self, start_days: np.ndarray, end_days: np.ndarray) -> np.ndarray:
+        year1 = start_days.astype("datetime64[Y]")
+        year2 = end_days.astype("datetime64[Y]")
+        days_in_year1 = ((year1 + 1).astype("datetime64[D]") - year1.astype("datetime64[D]")).astype(np.int64)
+        days_in_year2 = ((year2 + 1).astype("datetime64[D]") - year2.astype("datetime64[D]")).astype(np.int64)
+
+        same_year = (end_days - start_days).astype(np.int64) / days_in_year1
+        first_fraction = ((year1 + 1).astype("datetime64[D]") - start_days).astype(np.int64) / days_in_year1
+        last_fraction = (end_days - year2.astype("datetime64[D]")).astype(np.int64) / days_in_year2
+        full_years = (year2 - year1).astype(np.int64) - 1
+        return np.where(year1 == year2, same_year, first_fraction + full_years + last_fraction)
+
+    def _thirty_360_vec(self, start_days: np.ndarray, end_days: np.ndarray) -> np.ndarray:
+        year1, month1, day1 = self._split_dates(start_days)
+        year2, month2, day2 = self._split_dates(end_days)
+        d1 = np.minimum(day1, 30)
+        d2 = np.where(day1 >= 30, np.minimum(day2, 30), day2)
+        days_360 = 360 * (year2 - year1) + 30 * (month2 - month1) + (d2 - d1)
+        return days_360 / 360.0
+
     def _actual_actual(self, start_date: date, end_date: date) -> float:
         year1 = start_date.year
         year2 = end_date.year
@@ -18,9 +18,11 @@ class PricingSettings:
         nb_paths: Optional[int] = None,
         nb_steps: Optional[int] = None,
         random_seed: Optional[int] = 4012,
+        antithetic: bool = False,
         compute_greeks: bool = False,
         valuation_date: Optional[datetime] = None,
         compute_callable_coupons: bool = False,
+        payoff_workers: Optional[int] = None,
     ):
         self.underlying_name = underlying_name
         self.rate_curve_type = rate_curve_type
@@ -33,7 +35,9 @@ class PricingSettings:
         self.nb_paths = nb_paths
         self.nb_steps = nb_steps
         self.random_seed = random_seed
+        self.antithetic = antithetic
         self.compute_greeks = compute_greeks
         self.valuation_date = valuation_date
         self.compute_callable_coupons = compute_callable_coupons
+        self.payoff_workers = payoff_workers
 